@@ -4,23 +4,61 @@
 This package contains the Flask application factory and core components.
 """
 
+import json
 import os
 from flask import Flask
 from flask_socketio import SocketIO
 
+# Optional faster JSON codec for Socket.IO packets (stdlib json if unavailable)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 __version__ = "0.1.0"
 
+
+class OrjsonCodec:
+    """
+    orjson-backed JSON module for python-socketio.
+
+    Socket.IO calls ``dumps``/``loads`` for every packet; orjson encodes
+    and decodes dict payloads several times faster than stdlib json.
+    Socket.IO expects ``dumps`` to return ``str`` so the bytes are decoded,
+    and stdlib-only keyword arguments such as ``separators`` are ignored
+    (orjson output is always compact).
+
+    orjson rejects the ``NaN``/``Infinity`` literals that stdlib json emits
+    for unset floats, so packets it cannot parse are retried with stdlib json.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    @staticmethod
+    def loads(s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s, **kwargs)
+
+
 # Initialize SocketIO (will be bound to app in create_app)
-socketio = SocketIO()
+socketio = SocketIO(json=OrjsonCodec) if orjson is not None else SocketIO()
 
 
-def create_app():
+def create_app(test_config=None):
     """
     Flask application factory.
 
     Creates and configures the Flask application with SocketIO support,
     loads configuration, and registers routes.
 
+    Args:
+        test_config: Optional mapping applied over config.Config before
+            SocketIO is initialised (e.g. {'SOCKETIO_ASYNC_MODE': 'threading'})
+
     Returns:
         Flask: Configured Flask application instance
     """
@@ -36,11 +74,19 @@ def create_app():
 
     # Load configuration from config.py
     app.config.from_object('config.Config')
+    if test_config:
+        app.config.update(test_config)
 
     # Initialize SocketIO with CORS support
     # cors_allowed_origins="*" allows connections from any origin (development)
     # In production, this should be restricted to specific domains
-    socketio.init_app(app, cors_allowed_origins="*")
+    # WebSocket transport only by default (SOCKETIO_TRANSPORTS): no long-polling
+    # HTTP request per message and no sticky sessions needed; clients must
+    # connect with transports=['websocket']. Upgrades only matter with polling.
+    transports = app.config.get('SOCKETIO_TRANSPORTS') or ['websocket']
+    socketio.init_app(app, cors_allowed_origins="*",
+                      transports=transports, allow_upgrades='polling' in transports,
+                      async_mode=app.config.get('SOCKETIO_ASYNC_MODE'))
 
     # Import and register routes and WebSocket handlers (must be after socketio.init_app)
     # This import is inside the function to avoid circular imports
@@ -48,4 +94,16 @@ def create_app():
     register_routes(app)
     register_socketio_handlers(socketio)
 
+    # Optionally coalesce telemetry broadcasts (see TELEMETRY_BROADCAST_INTERVAL)
+    interval = app.config.get('TELEMETRY_BROADCAST_INTERVAL')
+    if interval:
+        from app.main import start_telemetry_flusher
+        start_telemetry_flusher(socketio, interval)
+
+    # Optionally delete abandoned sessions (see SESSION_IDLE_TIMEOUT)
+    max_idle = app.config.get('SESSION_IDLE_TIMEOUT')
+    if max_idle:
+        from app.main import start_session_sweeper
+        start_session_sweeper(socketio, max_idle, app.config['SESSION_SWEEP_INTERVAL'])
+
     return app
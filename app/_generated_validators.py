@@ -0,0 +1,222 @@
+"""
+Schema validators generated by tools/compile_schemas.py - DO NOT EDIT.
+
+Regenerate with `python tools/compile_schemas.py` after changing any schema
+in bugs/schemas/.
+"""
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate_https___1lap_dev_schemas_telemetry_update_v1_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/telemetry_update.v1.json', 'title': 'Telemetry Update Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'telemetry'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'telemetry': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_wear': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'brake_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}, 'definitions': {'FourWheels': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'TelemetryPayload': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_wear': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'brake_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['session_id', 'telemetry']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/telemetry_update.v1.json', 'title': 'Telemetry Update Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'telemetry'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'telemetry': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_wear': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'brake_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}, 'definitions': {'FourWheels': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'TelemetryPayload': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_wear': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'brake_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "session_id" in data_keys:
+            data_keys.remove("session_id")
+            data__sessionid = data["session_id"]
+            if not isinstance(data__sessionid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".session_id must be string", value=data__sessionid, name="" + (name_prefix or "data") + ".session_id", definition={'type': 'string', 'format': 'uuid'}, rule='type')
+        if "telemetry" in data_keys:
+            data_keys.remove("telemetry")
+            data__telemetry = data["telemetry"]
+            validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_telemetrypayload(data__telemetry, custom_formats, (name_prefix or "data") + ".telemetry")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/telemetry_update.v1.json', 'title': 'Telemetry Update Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'telemetry'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'telemetry': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'tire_wear': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'brake_temps': {'$ref': 'https://1lap.dev/schemas/telemetry_update.v1.json#/definitions/FourWheels'}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}, 'definitions': {'FourWheels': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'TelemetryPayload': {'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_wear': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'brake_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}}}, rule='additionalProperties')
+    return data
+
+def validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_telemetrypayload(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_wear': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'brake_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': True, 'required': ['timestamp', 'lap', 'position', 'fuel', 'fuel_capacity', 'player_name', 'car_name', 'track_name', 'session_type'], 'properties': {'timestamp': {'type': 'string', 'format': 'date-time'}, 'lap': {'type': 'integer', 'minimum': 0}, 'position': {'type': 'integer', 'minimum': 0}, 'lap_time': {'type': 'number', 'minimum': 0}, 'fuel': {'type': 'number', 'minimum': 0}, 'fuel_capacity': {'type': 'number', 'minimum': 0}, 'tire_pressures': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'tire_wear': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'brake_temps': {'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, 'engine_water_temp': {'type': 'number'}, 'track_temp': {'type': 'number'}, 'ambient_temp': {'type': 'number'}, 'speed': {'type': 'number'}, 'gear': {'type': 'integer'}, 'rpm': {'type': 'number'}, 'player_name': {'type': 'string'}, 'car_name': {'type': 'string'}, 'track_name': {'type': 'string'}, 'session_type': {'type': 'string'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "timestamp" in data_keys:
+            data_keys.remove("timestamp")
+            data__timestamp = data["timestamp"]
+            if not isinstance(data__timestamp, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be string", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'string', 'format': 'date-time'}, rule='type')
+        if "lap" in data_keys:
+            data_keys.remove("lap")
+            data__lap = data["lap"]
+            if not isinstance(data__lap, (int)) and not (isinstance(data__lap, float) and data__lap.is_integer()) or isinstance(data__lap, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lap must be integer", value=data__lap, name="" + (name_prefix or "data") + ".lap", definition={'type': 'integer', 'minimum': 0}, rule='type')
+            if isinstance(data__lap, (int, float, Decimal)):
+                if data__lap < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".lap must be bigger than or equal to 0", value=data__lap, name="" + (name_prefix or "data") + ".lap", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+        if "position" in data_keys:
+            data_keys.remove("position")
+            data__position = data["position"]
+            if not isinstance(data__position, (int)) and not (isinstance(data__position, float) and data__position.is_integer()) or isinstance(data__position, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".position must be integer", value=data__position, name="" + (name_prefix or "data") + ".position", definition={'type': 'integer', 'minimum': 0}, rule='type')
+            if isinstance(data__position, (int, float, Decimal)):
+                if data__position < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".position must be bigger than or equal to 0", value=data__position, name="" + (name_prefix or "data") + ".position", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+        if "lap_time" in data_keys:
+            data_keys.remove("lap_time")
+            data__laptime = data["lap_time"]
+            if not isinstance(data__laptime, (int, float, Decimal)) or isinstance(data__laptime, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lap_time must be number", value=data__laptime, name="" + (name_prefix or "data") + ".lap_time", definition={'type': 'number', 'minimum': 0}, rule='type')
+            if isinstance(data__laptime, (int, float, Decimal)):
+                if data__laptime < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".lap_time must be bigger than or equal to 0", value=data__laptime, name="" + (name_prefix or "data") + ".lap_time", definition={'type': 'number', 'minimum': 0}, rule='minimum')
+        if "fuel" in data_keys:
+            data_keys.remove("fuel")
+            data__fuel = data["fuel"]
+            if not isinstance(data__fuel, (int, float, Decimal)) or isinstance(data__fuel, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fuel must be number", value=data__fuel, name="" + (name_prefix or "data") + ".fuel", definition={'type': 'number', 'minimum': 0}, rule='type')
+            if isinstance(data__fuel, (int, float, Decimal)):
+                if data__fuel < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fuel must be bigger than or equal to 0", value=data__fuel, name="" + (name_prefix or "data") + ".fuel", definition={'type': 'number', 'minimum': 0}, rule='minimum')
+        if "fuel_capacity" in data_keys:
+            data_keys.remove("fuel_capacity")
+            data__fuelcapacity = data["fuel_capacity"]
+            if not isinstance(data__fuelcapacity, (int, float, Decimal)) or isinstance(data__fuelcapacity, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fuel_capacity must be number", value=data__fuelcapacity, name="" + (name_prefix or "data") + ".fuel_capacity", definition={'type': 'number', 'minimum': 0}, rule='type')
+            if isinstance(data__fuelcapacity, (int, float, Decimal)):
+                if data__fuelcapacity < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fuel_capacity must be bigger than or equal to 0", value=data__fuelcapacity, name="" + (name_prefix or "data") + ".fuel_capacity", definition={'type': 'number', 'minimum': 0}, rule='minimum')
+        if "tire_pressures" in data_keys:
+            data_keys.remove("tire_pressures")
+            data__tirepressures = data["tire_pressures"]
+            validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_fourwheels(data__tirepressures, custom_formats, (name_prefix or "data") + ".tire_pressures")
+        if "tire_temps" in data_keys:
+            data_keys.remove("tire_temps")
+            data__tiretemps = data["tire_temps"]
+            validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_fourwheels(data__tiretemps, custom_formats, (name_prefix or "data") + ".tire_temps")
+        if "tire_wear" in data_keys:
+            data_keys.remove("tire_wear")
+            data__tirewear = data["tire_wear"]
+            validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_fourwheels(data__tirewear, custom_formats, (name_prefix or "data") + ".tire_wear")
+        if "brake_temps" in data_keys:
+            data_keys.remove("brake_temps")
+            data__braketemps = data["brake_temps"]
+            validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_fourwheels(data__braketemps, custom_formats, (name_prefix or "data") + ".brake_temps")
+        if "engine_water_temp" in data_keys:
+            data_keys.remove("engine_water_temp")
+            data__enginewatertemp = data["engine_water_temp"]
+            if not isinstance(data__enginewatertemp, (int, float, Decimal)) or isinstance(data__enginewatertemp, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".engine_water_temp must be number", value=data__enginewatertemp, name="" + (name_prefix or "data") + ".engine_water_temp", definition={'type': 'number'}, rule='type')
+        if "track_temp" in data_keys:
+            data_keys.remove("track_temp")
+            data__tracktemp = data["track_temp"]
+            if not isinstance(data__tracktemp, (int, float, Decimal)) or isinstance(data__tracktemp, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".track_temp must be number", value=data__tracktemp, name="" + (name_prefix or "data") + ".track_temp", definition={'type': 'number'}, rule='type')
+        if "ambient_temp" in data_keys:
+            data_keys.remove("ambient_temp")
+            data__ambienttemp = data["ambient_temp"]
+            if not isinstance(data__ambienttemp, (int, float, Decimal)) or isinstance(data__ambienttemp, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ambient_temp must be number", value=data__ambienttemp, name="" + (name_prefix or "data") + ".ambient_temp", definition={'type': 'number'}, rule='type')
+        if "speed" in data_keys:
+            data_keys.remove("speed")
+            data__speed = data["speed"]
+            if not isinstance(data__speed, (int, float, Decimal)) or isinstance(data__speed, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".speed must be number", value=data__speed, name="" + (name_prefix or "data") + ".speed", definition={'type': 'number'}, rule='type')
+        if "gear" in data_keys:
+            data_keys.remove("gear")
+            data__gear = data["gear"]
+            if not isinstance(data__gear, (int)) and not (isinstance(data__gear, float) and data__gear.is_integer()) or isinstance(data__gear, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".gear must be integer", value=data__gear, name="" + (name_prefix or "data") + ".gear", definition={'type': 'integer'}, rule='type')
+        if "rpm" in data_keys:
+            data_keys.remove("rpm")
+            data__rpm = data["rpm"]
+            if not isinstance(data__rpm, (int, float, Decimal)) or isinstance(data__rpm, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rpm must be number", value=data__rpm, name="" + (name_prefix or "data") + ".rpm", definition={'type': 'number'}, rule='type')
+        if "player_name" in data_keys:
+            data_keys.remove("player_name")
+            data__playername = data["player_name"]
+            if not isinstance(data__playername, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".player_name must be string", value=data__playername, name="" + (name_prefix or "data") + ".player_name", definition={'type': 'string'}, rule='type')
+        if "car_name" in data_keys:
+            data_keys.remove("car_name")
+            data__carname = data["car_name"]
+            if not isinstance(data__carname, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".car_name must be string", value=data__carname, name="" + (name_prefix or "data") + ".car_name", definition={'type': 'string'}, rule='type')
+        if "track_name" in data_keys:
+            data_keys.remove("track_name")
+            data__trackname = data["track_name"]
+            if not isinstance(data__trackname, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".track_name must be string", value=data__trackname, name="" + (name_prefix or "data") + ".track_name", definition={'type': 'string'}, rule='type')
+        if "session_type" in data_keys:
+            data_keys.remove("session_type")
+            data__sessiontype = data["session_type"]
+            if not isinstance(data__sessiontype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".session_type must be string", value=data__sessiontype, name="" + (name_prefix or "data") + ".session_type", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate_https___1lap_dev_schemas_telemetry_update_v1_json__definitions_fourwheels(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "fl" in data_keys:
+            data_keys.remove("fl")
+            data__fl = data["fl"]
+            if not isinstance(data__fl, (int, float, Decimal)) or isinstance(data__fl, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fl must be number", value=data__fl, name="" + (name_prefix or "data") + ".fl", definition={'type': 'number'}, rule='type')
+        if "fr" in data_keys:
+            data_keys.remove("fr")
+            data__fr = data["fr"]
+            if not isinstance(data__fr, (int, float, Decimal)) or isinstance(data__fr, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fr must be number", value=data__fr, name="" + (name_prefix or "data") + ".fr", definition={'type': 'number'}, rule='type')
+        if "rl" in data_keys:
+            data_keys.remove("rl")
+            data__rl = data["rl"]
+            if not isinstance(data__rl, (int, float, Decimal)) or isinstance(data__rl, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rl must be number", value=data__rl, name="" + (name_prefix or "data") + ".rl", definition={'type': 'number'}, rule='type')
+        if "rr" in data_keys:
+            data_keys.remove("rr")
+            data__rr = data["rr"]
+            if not isinstance(data__rr, (int, float, Decimal)) or isinstance(data__rr, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rr must be number", value=data__rr, name="" + (name_prefix or "data") + ".rr", definition={'type': 'number'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'fl': {'type': 'number'}, 'fr': {'type': 'number'}, 'rl': {'type': 'number'}, 'rr': {'type': 'number'}}}, rule='additionalProperties')
+    return data
+
+
+def validate_https___1lap_dev_schemas_setup_data_v1_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/setup_data.v1.json', 'title': 'Setup Data Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'timestamp', 'setup'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'timestamp': {'type': 'string', 'format': 'date-time'}, 'setup': {'type': 'object', 'description': 'Opaque LMU setup payload; server stores and broadcasts as-is.', 'additionalProperties': True}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['session_id', 'timestamp', 'setup']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/setup_data.v1.json', 'title': 'Setup Data Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'timestamp', 'setup'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'timestamp': {'type': 'string', 'format': 'date-time'}, 'setup': {'type': 'object', 'description': 'Opaque LMU setup payload; server stores and broadcasts as-is.', 'additionalProperties': True}}}, rule='required')
+        data_keys = set(data.keys())
+        if "session_id" in data_keys:
+            data_keys.remove("session_id")
+            data__sessionid = data["session_id"]
+            if not isinstance(data__sessionid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".session_id must be string", value=data__sessionid, name="" + (name_prefix or "data") + ".session_id", definition={'type': 'string', 'format': 'uuid'}, rule='type')
+        if "timestamp" in data_keys:
+            data_keys.remove("timestamp")
+            data__timestamp = data["timestamp"]
+            if not isinstance(data__timestamp, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be string", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'string', 'format': 'date-time'}, rule='type')
+        if "setup" in data_keys:
+            data_keys.remove("setup")
+            data__setup = data["setup"]
+            if not isinstance(data__setup, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".setup must be object", value=data__setup, name="" + (name_prefix or "data") + ".setup", definition={'type': 'object', 'description': 'Opaque LMU setup payload; server stores and broadcasts as-is.', 'additionalProperties': True}, rule='type')
+            data__setup_is_dict = isinstance(data__setup, dict)
+            if data__setup_is_dict:
+                data__setup_keys = set(data__setup.keys())
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', '$id': 'https://1lap.dev/schemas/setup_data.v1.json', 'title': 'Setup Data Envelope v1', 'type': 'object', 'additionalProperties': False, 'required': ['session_id', 'timestamp', 'setup'], 'properties': {'session_id': {'type': 'string', 'format': 'uuid'}, 'timestamp': {'type': 'string', 'format': 'date-time'}, 'setup': {'type': 'object', 'description': 'Opaque LMU setup payload; server stores and broadcasts as-is.', 'additionalProperties': True}}}, rule='additionalProperties')
+    return data
+
+
+validate_telemetry = validate_https___1lap_dev_schemas_telemetry_update_v1_json
+validate_setup = validate_https___1lap_dev_schemas_setup_data_v1_json
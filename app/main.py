@@ -5,30 +5,95 @@ Provides HTTP endpoints for the home page and dashboard views,
 as well as WebSocket event handlers for real-time communication.
 """
 
-from flask import render_template
+from flask import current_app, make_response, render_template, request
+from markupsafe import escape
 from flask_socketio import emit, join_room
 from app.session_manager import SessionManager
 import logging
 import os
+import sys
 from pathlib import Path
 import json
 
-# Optional schema validation (enabled if jsonschema is available)
+# Optional faster JSON parser for schema files (stdlib json if unavailable)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Optional schema validation (enabled if fastjsonschema or jsonschema is available)
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    FASTJSONSCHEMA_AVAILABLE = False
+
 try:
     from jsonschema import Draft202012Validator, ValidationError
     JSONSCHEMA_AVAILABLE = True
 except Exception:  # pragma: no cover - optional dependency
     JSONSCHEMA_AVAILABLE = False
 
+# Exceptions raised by the compiled validators when a payload is rejected
+SCHEMA_ERRORS = tuple(
+    [fastjsonschema.JsonSchemaException] if FASTJSONSCHEMA_AVAILABLE else []
+) + tuple([ValidationError] if JSONSCHEMA_AVAILABLE else [])
+
+# Maps event name -> callable(data) that raises one of SCHEMA_ERRORS on invalid input
 SCHEMA_VALIDATORS = {}
 # Schema validation is opt-in so basic test payloads aren't rejected when
 # optional fields are missing. Enable by setting ENABLE_SCHEMA_VALIDATION=true.
 VALIDATION_ENABLED = False
 VALIDATION_REQUESTED = os.environ.get('ENABLE_SCHEMA_VALIDATION', 'false').lower() == 'true'
 
+def _compile_validator(schema):
+    """
+    Build a validation callable for a JSON schema.
+
+    Prefers fastjsonschema, which generates plain Python code for the schema
+    once so each message is checked without walking the schema keywords.
+    Falls back to jsonschema's Draft202012Validator when it is not installed.
+
+    Args:
+        schema: Parsed JSON schema dict
+
+    Returns:
+        Callable taking the payload and raising one of SCHEMA_ERRORS if invalid
+    """
+    if FASTJSONSCHEMA_AVAILABLE:
+        # Match jsonschema's behaviour: formats are annotations only and
+        # payloads are never modified with schema defaults
+        return fastjsonschema.compile(schema, use_default=False, use_formats=False)
+
+    # Fail fast: stop at the first error instead of collecting the rest
+    iter_errors = Draft202012Validator(schema).iter_errors
+
+    def validate(data):
+        error = next(iter_errors(data), None)
+        if error is not None:
+            raise error
+
+    return validate
+
+
 def _load_schema_validators():
     global SCHEMA_VALIDATORS, VALIDATION_ENABLED
-    if not JSONSCHEMA_AVAILABLE or not VALIDATION_REQUESTED:
+    if not VALIDATION_REQUESTED:
+        return
+
+    # Prefer validators generated ahead of time by tools/compile_schemas.py:
+    # no schema file reads, JSON parsing or code generation at startup
+    try:
+        from app._generated_validators import validate_telemetry, validate_setup
+    except ImportError:
+        pass
+    else:
+        SCHEMA_VALIDATORS['telemetry_update'] = validate_telemetry
+        SCHEMA_VALIDATORS['setup_data'] = validate_setup
+        VALIDATION_ENABLED = True
+        return
+
+    if not (FASTJSONSCHEMA_AVAILABLE or JSONSCHEMA_AVAILABLE):
         return
 
     # Resolve schemas directory within dashboard repo: dashboard/bugs/schemas/
@@ -36,14 +101,14 @@ def _load_schema_validators():
     telemetry_schema_path = schemas_dir / 'telemetry_update.schema.json'
     setup_schema_path = schemas_dir / 'setup_data.schema.json'
 
+    # Parse raw bytes directly; both parsers accept UTF-8 bytes
+    loads = orjson.loads if orjson is not None else json.loads
     try:
-        with telemetry_schema_path.open('r', encoding='utf-8') as f:
-            telemetry_schema = json.load(f)
-        with setup_schema_path.open('r', encoding='utf-8') as f:
-            setup_schema = json.load(f)
+        telemetry_schema = loads(telemetry_schema_path.read_bytes())
+        setup_schema = loads(setup_schema_path.read_bytes())
 
-        SCHEMA_VALIDATORS['telemetry_update'] = Draft202012Validator(telemetry_schema)
-        SCHEMA_VALIDATORS['setup_data'] = Draft202012Validator(setup_schema)
+        SCHEMA_VALIDATORS['telemetry_update'] = _compile_validator(telemetry_schema)
+        SCHEMA_VALIDATORS['setup_data'] = _compile_validator(setup_schema)
         VALIDATION_ENABLED = True
     except Exception:
         # If loading fails, leave validation disabled but keep server running
@@ -55,6 +120,13 @@ logger = logging.getLogger(__name__)
 # Create a global session manager instance
 session_manager = SessionManager()
 
+# Set once the telemetry flusher / idle-session sweeper task is running
+_flusher_started = False
+_sweeper_started = False
+
+# Placeholder rendered into dashboard.html in place of the session ID
+_SESSION_ID_SENTINEL = '__1LAP_SESSION_ID__'
+
 
 def register_routes(app):
     """
@@ -63,6 +135,8 @@ def register_routes(app):
     Args:
         app: Flask application instance
     """
+    # dashboard.html split around the session ID (filled on first request)
+    dashboard_parts = []
 
     @app.route('/')
     def index():
@@ -70,40 +144,13 @@ def register_routes(app):
         Home page - server status.
 
         Returns:
-            str: HTML response showing server status
-        """
-        return """
-        <html>
-            <head>
-                <title>1Lap Race Dashboard Server</title>
-                <style>
-                    body {
-                        font-family: Arial, sans-serif;
-                        max-width: 800px;
-                        margin: 50px auto;
-                        padding: 20px;
-                        background-color: #f5f5f5;
-                    }
-                    h1 {
-                        color: #333;
-                    }
-                    .info {
-                        background-color: white;
-                        padding: 20px;
-                        border-radius: 5px;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                    }
-                </style>
-            </head>
-            <body>
-                <h1>1Lap Race Dashboard Server</h1>
-                <div class="info">
-                    <p>Server is running and waiting for monitor connections...</p>
-                    <p>Dashboard URLs will be generated when a monitor connects.</p>
-                </div>
-            </body>
-        </html>
+            Response: Rendered index.html with caching headers (304 if unchanged)
         """
+        response = make_response(render_template('index.html'))
+        # Static content: let browsers and proxies cache it and revalidate via ETag
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+        response.add_etag()
+        return response.make_conditional(request)
 
     @app.route('/dashboard/<session_id>')
     def dashboard(session_id):
@@ -115,8 +162,114 @@ def register_routes(app):
 
         Returns:
             str: Rendered dashboard HTML template
+
+        The template is rendered once with a placeholder session ID and split
+        around it; each request then only escapes and joins the session ID.
+        Skipped when TEMPLATES_AUTO_RELOAD is set so template edits show up.
         """
-        return render_template('dashboard.html', session_id=session_id)
+        if app.config.get('TEMPLATES_AUTO_RELOAD'):
+            return render_template('dashboard.html', session_id=session_id)
+
+        if not dashboard_parts:
+            html = render_template('dashboard.html', session_id=_SESSION_ID_SENTINEL)
+            # Assign in one step: concurrent first requests may both get here,
+            # and the later one must replace the parts rather than append
+            dashboard_parts[:] = html.split(_SESSION_ID_SENTINEL)
+        # Same HTML escaping Jinja's autoescape applies to {{ session_id }}
+        return str(escape(session_id)).join(dashboard_parts)
+
+
+def _emit_to_dashboards(event, payload, session):
+    """
+    Send an event to the dashboards of a session, never back to the sender.
+
+    Broadcasts go to the session's room, so the packet is encoded once for
+    every dashboard. A lone dashboard (the common case) is addressed by SID,
+    which skips the room lookup.
+
+    Args:
+        event: Event name
+        payload: Prebuilt event payload
+        session: Session whose dashboards receive the event
+    """
+    sids = tuple(session.dashboard_sids)
+    if len(sids) == 1:
+        if sids[0] != request.sid:
+            emit(event, payload, to=sids[0])
+    elif sids:
+        emit(event, payload, to=session.session_id, include_self=False)
+
+
+def flush_pending_telemetry(socketio):
+    """
+    Broadcast the latest telemetry of every session updated since the last flush.
+
+    Args:
+        socketio: Flask-SocketIO instance
+    """
+    for session in session_manager.drain_pending_telemetry():
+        sids = tuple(session.dashboard_sids)
+        if len(sids) == 1:
+            socketio.emit('telemetry_update', session.telemetry_payload, to=sids[0])
+        elif sids:
+            socketio.emit('telemetry_update', session.telemetry_payload, to=session.session_id)
+
+
+def start_telemetry_flusher(socketio, interval):
+    """
+    Start the background task that coalesces telemetry broadcasts.
+
+    Updates received between flushes are collapsed into one broadcast of the
+    newest telemetry, capping each session at 1/interval broadcasts per second.
+    Only one flusher runs per process; later calls are ignored.
+
+    Args:
+        socketio: Flask-SocketIO instance
+        interval: Seconds between flushes
+    """
+    global _flusher_started
+    if _flusher_started:
+        return
+    _flusher_started = True
+
+    def flusher():
+        while True:
+            socketio.sleep(interval)
+            try:
+                flush_pending_telemetry(socketio)
+            except Exception as e:
+                logger.error(f"Error flushing telemetry: {str(e)}")
+
+    socketio.start_background_task(flusher)
+
+
+def start_session_sweeper(socketio, max_idle, interval):
+    """
+    Start the background task that deletes idle sessions.
+
+    Only one sweeper runs per process; later calls are ignored.
+
+    Args:
+        socketio: Flask-SocketIO instance
+        max_idle: Seconds without monitor activity before a session with no
+            dashboards is deleted
+        interval: Seconds between sweeps
+    """
+    global _sweeper_started
+    if _sweeper_started:
+        return
+    _sweeper_started = True
+
+    def sweeper():
+        while True:
+            socketio.sleep(interval)
+            try:
+                for session_id in session_manager.evict_idle_sessions(max_idle):
+                    logger.info(f"Deleted idle session: {session_id}")
+            except Exception as e:
+                logger.error(f"Error sweeping sessions: {str(e)}")
+
+    socketio.start_background_task(sweeper)
 
 
 def register_socketio_handlers(socketio):
@@ -149,8 +302,10 @@ def register_socketio_handlers(socketio):
         """
         Handle client disconnection from WebSocket server.
 
-        Logs disconnection.
+        Logs disconnection and unsubscribes the client from any sessions
+        it joined as a dashboard.
         """
+        session_manager.remove_dashboard(request.sid)
         logger.info(f"Client disconnected")
 
     @socketio.on('request_session_id')
@@ -187,18 +342,18 @@ def register_socketio_handlers(socketio):
                 - setup: dict (car setup from REST API)
 
         Flow:
-            1. Validate session exists
+            1. Validate session ID format and that the session exists
             2. Store setup in SessionManager
             3. Broadcast 'setup_update' to all dashboards in session room
 
         Emits:
-            setup_update: Setup data to all clients in session room
+            setup_update: Setup data to all dashboards in session
         """
         # Validate against schema if enabled
-        if VALIDATION_ENABLED:
+        if _validate_setup is not None:
             try:
-                SCHEMA_VALIDATORS['setup_data'].validate(data)
-            except Exception as e:
+                _validate_setup(data)
+            except SCHEMA_ERRORS as e:
                 logger.warning(f"Invalid setup_data payload rejected: {e}")
                 return
 
@@ -206,22 +361,23 @@ def register_socketio_handlers(socketio):
         timestamp = data.get('timestamp')
         setup = data.get('setup')
 
-        # Validate session exists
-        if not session_id or not session_manager.get_session(session_id):
+        # Validate session ID format, then that the session exists
+        is_valid, _ = session_manager.validate_session_id(session_id)
+        if is_valid:
+            # Interned: the session store's keys are interned at creation
+            session_id = sys.intern(session_id)
+        session = session_manager.get_session(session_id) if is_valid else None
+        if not session:
             logger.warning(f"Setup data received for invalid session: {session_id}")
             return
 
         try:
             # Store setup in session
-            session_manager.update_setup(session_id, setup, timestamp)
+            session_manager.update_setup(session_id, setup, timestamp, session=session)
             logger.info(f"Stored setup for session {session_id}")
 
-            # Broadcast to all dashboards in room
-            emit('setup_update', {
-                'session_id': session_id,
-                'timestamp': timestamp,
-                'setup': setup
-            }, room=session_id)
+            # Broadcast to the session's dashboards, not back to the monitor
+            _emit_to_dashboards('setup_update', session.setup_payload, session)
 
         except Exception as e:
             logger.error(f"Error handling setup data: {str(e)}")
@@ -237,39 +393,48 @@ def register_socketio_handlers(socketio):
                 - telemetry: dict (real-time telemetry data)
 
         Flow:
-            1. Validate session exists
+            1. Validate session ID format and that the session exists
             2. Store telemetry in SessionManager
-            3. Broadcast 'telemetry_update' to all dashboards in session room
+            3. Broadcast 'telemetry_update' to all dashboards in session room,
+               or queue it for the coalescing flusher if
+               TELEMETRY_BROADCAST_INTERVAL is set
 
         Emits:
-            telemetry_update: Telemetry data to all clients in session room
+            telemetry_update: Telemetry data to all dashboards in session
         """
         # Validate against schema if enabled
-        if VALIDATION_ENABLED:
+        if _validate_telemetry is not None:
             try:
-                SCHEMA_VALIDATORS['telemetry_update'].validate(data)
-            except Exception as e:
+                _validate_telemetry(data)
+            except SCHEMA_ERRORS as e:
                 logger.warning(f"Invalid telemetry_update payload rejected: {e}")
                 return
 
         session_id = data.get('session_id')
         telemetry = data.get('telemetry')
 
-        # Validate session exists
-        if not session_id or not session_manager.get_session(session_id):
+        # Validate session ID format, then that the session exists
+        is_valid, _ = session_manager.validate_session_id(session_id)
+        if is_valid:
+            # Interned: the session store's keys are interned at creation
+            session_id = sys.intern(session_id)
+        session = session_manager.get_session(session_id) if is_valid else None
+        if not session:
             logger.warning(f"Telemetry received for invalid session: {session_id}")
             return
 
         try:
             # Store telemetry in session
-            session_manager.update_telemetry(session_id, telemetry)
+            session_manager.update_telemetry(session_id, telemetry, session=session)
             logger.debug(f"Updated telemetry for session {session_id}")
 
-            # Broadcast to all dashboards in room
-            emit('telemetry_update', {
-                'session_id': session_id,
-                'telemetry': telemetry
-            }, room=session_id)
+            # Coalescing enabled: the flusher sends the latest telemetry
+            if current_app.config.get('TELEMETRY_BROADCAST_INTERVAL'):
+                session_manager.mark_telemetry_pending(session_id)
+                return
+
+            # Broadcast to the session's dashboards, not back to the monitor
+            _emit_to_dashboards('telemetry_update', session.telemetry_payload, session)
 
         except Exception as e:
             logger.error(f"Error handling telemetry: {str(e)}")
@@ -284,8 +449,8 @@ def register_socketio_handlers(socketio):
                 - session_id: str (UUID)
 
         Flow:
-            1. Validate session_id is present and valid
-            2. Add client to session room
+            1. Validate session_id is present, well-formed, and exists
+            2. Add client to session room and record its SID on the session
             3. Send current setup (if available)
             4. Send current telemetry (if available)
 
@@ -300,30 +465,36 @@ def register_socketio_handlers(socketio):
             logger.warning("Dashboard tried to join without session_id")
             return
 
+        # Validate session ID format
+        is_valid, error = session_manager.validate_session_id(session_id)
+        if not is_valid:
+            logger.warning(f"Dashboard tried to join with invalid session_id: {error}")
+            return
+        session_id = sys.intern(session_id)
+
         # Validate session exists
         session = session_manager.get_session(session_id)
         if not session:
             logger.warning(f"Dashboard tried to join non-existent session: {session_id}")
             return
 
-        # Add client to session room
+        # Add client to session room; the recorded SID lets a lone dashboard
+        # be addressed directly and is dropped again on disconnect
         join_room(session_id)
+        session_manager.add_dashboard(session_id, request.sid)
         logger.info(f"Dashboard joined session: {session_id}")
 
         # Send current setup if available
-        if session.get('setup'):
-            emit('setup_update', {
-                'session_id': session_id,
-                'timestamp': session['setup_timestamp'],
-                'setup': session['setup']
-            })
+        if session.setup:
+            emit('setup_update', session.setup_payload)
 
         # Send current telemetry if available
-        if session.get('telemetry'):
-            emit('telemetry_update', {
-                'session_id': session_id,
-                'telemetry': session['telemetry']
-            })
+        if session.telemetry:
+            emit('telemetry_update', session.telemetry_payload)
 
 # Initialize schema validators at import time
 _load_schema_validators()
+
+# Bind validators once so handlers skip the registry lookup per message
+_validate_telemetry = SCHEMA_VALIDATORS.get('telemetry_update')
+_validate_setup = SCHEMA_VALIDATORS.get('setup_data')
@@ -5,9 +5,92 @@ Handles creation of unique session IDs, storage of session data
 (setup and telemetry), and session lifecycle management.
 """
 
+import functools
+import os
+import re
+import sys
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+# Canonical (lowercase, hyphenated) UUID string as produced by str(uuid.UUID(...))
+_UUID_RE = re.compile(r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z')
+
+_INVALID_UUID = (False, "Invalid UUID format: expected canonical lowercase UUID")
+
+# Number of session IDs generated from each os.urandom() call
+_UUID_BATCH = 256
+
+# Last formatted timestamp, reused for every update within the same second
+_last_ts_sec: Optional[int] = None
+_last_ts_str: Optional[str] = None
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string at one-second resolution.
+
+    Telemetry arrives at 2Hz per session and the value is only diagnostic,
+    so the formatted string is cached and reused until the second changes.
+
+    Returns:
+        str: e.g. '2025-11-22T14:30:00+00:00'
+    """
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _last_ts_sec = now
+    return _last_ts_str
+
+
+@dataclass(slots=True)
+class Session:
+    """
+    State for a single racing session.
+
+    A fixed-field slotted record: no per-instance ``__dict__``, and field
+    reads are plain attribute loads.
+
+    Attributes:
+        session_id: UUID of the session
+        created_at: ISO 8601 creation timestamp
+        setup: Latest car setup from the monitor (None until received)
+        setup_timestamp: ISO 8601 timestamp the setup was taken
+        telemetry: Latest telemetry from the monitor (None until received)
+        last_update: ISO 8601 timestamp of the latest telemetry
+        setup_payload: Prebuilt 'setup_update' event envelope
+        telemetry_payload: Prebuilt 'telemetry_update' event envelope
+        dashboard_sids: Socket.IO SIDs of dashboards in the session's room
+        last_activity: time.monotonic() of creation or the latest monitor update
+    """
+
+    session_id: str
+    created_at: str
+    setup: Optional[Dict] = None
+    setup_timestamp: Optional[str] = None
+    telemetry: Optional[Dict] = None
+    last_update: Optional[str] = None
+    setup_payload: Optional[Dict] = None
+    telemetry_payload: Optional[Dict] = None
+    dashboard_sids: Set[str] = field(default_factory=set)
+    last_activity: float = field(default_factory=time.monotonic)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_session_id(session_id: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check a 36-character string against the canonical UUID pattern.
+
+    Cached because every monitor update and dashboard join re-validates one
+    of a small set of live session IDs.
+    """
+    if not _UUID_RE.match(session_id):
+        return _INVALID_UUID
+    return True, None
 
 
 class SessionManager:
@@ -16,11 +99,42 @@ class SessionManager:
 
     Attributes:
         _sessions: In-memory dictionary storing all active sessions
+        _dashboard_sessions: Reverse index of dashboard SID -> joined session IDs
+        _pending_telemetry: Session IDs with telemetry not yet broadcast
+
+    Each session also keeps the 'setup_update' and 'telemetry_update' event
+    envelopes (setup_payload / telemetry_payload), built once per update
+    so broadcasts and late-joining dashboards reuse the same object.
     """
 
     def __init__(self):
         """Initialize the SessionManager with empty session storage."""
-        self._sessions: Dict[str, Dict] = {}
+        self._sessions: Dict[str, Session] = {}
+        self._dashboard_sessions: Dict[str, Set[str]] = {}
+        self._pending_telemetry: Set[str] = set()
+        # Buffered randomness for session IDs (refilled every _UUID_BATCH IDs)
+        self._id_pool = b''
+        self._id_offset = 0
+        self._id_lock = threading.Lock()
+
+    def _new_session_id(self) -> str:
+        """
+        Generate a random UUID4 string from the buffered entropy pool.
+
+        Equivalent to str(uuid.uuid4()), but reads randomness from the OS in
+        batches of _UUID_BATCH IDs rather than one syscall per session, which
+        matters when many monitors reconnect at once.
+
+        Returns:
+            str: UUID4 in canonical 36-character form
+        """
+        with self._id_lock:
+            if self._id_offset >= len(self._id_pool):
+                self._id_pool = os.urandom(16 * _UUID_BATCH)
+                self._id_offset = 0
+            chunk = self._id_pool[self._id_offset:self._id_offset + 16]
+            self._id_offset += 16
+        return str(uuid.UUID(bytes=chunk, version=4))
 
     def create_session(self) -> str:
         """
@@ -29,18 +143,16 @@ class SessionManager:
         Returns:
             str: The newly created session ID (UUID4 format)
         """
-        session_id = str(uuid.uuid4())
-        self._sessions[session_id] = {
-            'session_id': session_id,
-            'created_at': datetime.utcnow().isoformat(),
-            'setup': None,
-            'setup_timestamp': None,
-            'telemetry': None,
-            'last_update': None
-        }
+        # Interned so lookups with an interned ID compare keys by identity
+        session_id = sys.intern(self._new_session_id())
+        self._sessions[session_id] = Session(
+            session_id=session_id,
+            created_at=_utc_timestamp(),
+            last_activity=time.monotonic()
+        )
         return session_id
 
-    def get_session(self, session_id: str) -> Optional[Dict]:
+    def get_session(self, session_id: str) -> Optional[Session]:
         """
         Retrieve session data by ID.
 
@@ -48,11 +160,12 @@ class SessionManager:
             session_id: The UUID of the session to retrieve
 
         Returns:
-            Dict containing session data, or None if session doesn't exist
+            Session containing session data, or None if session doesn't exist
         """
         return self._sessions.get(session_id)
 
-    def update_setup(self, session_id: str, setup: Dict, timestamp: str) -> None:
+    def update_setup(self, session_id: str, setup: Dict, timestamp: str,
+                     session: Optional[Session] = None) -> None:
         """
         Update the car setup data for a session.
 
@@ -60,32 +173,108 @@ class SessionManager:
             session_id: The UUID of the session
             setup: Dictionary containing car setup data from REST API
             timestamp: ISO 8601 timestamp when setup was received
+            session: The session's Session, if the caller already looked it
+                up (skips the store lookup)
 
         Raises:
             KeyError: If session_id doesn't exist
         """
-        if session_id not in self._sessions:
+        if session is None:
+            session = self._sessions.get(session_id)
+        if session is None:
             raise KeyError(f"Session {session_id} does not exist")
 
-        self._sessions[session_id]['setup'] = setup
-        self._sessions[session_id]['setup_timestamp'] = timestamp
+        session.setup = setup
+        session.setup_timestamp = timestamp
+        session.last_activity = time.monotonic()
+        session.setup_payload = {
+            'session_id': session_id,
+            'timestamp': timestamp,
+            'setup': setup
+        }
 
-    def update_telemetry(self, session_id: str, telemetry: Dict) -> None:
+    def update_telemetry(self, session_id: str, telemetry: Dict,
+                         session: Optional[Session] = None) -> None:
         """
         Update the latest telemetry data for a session.
 
         Args:
             session_id: The UUID of the session
             telemetry: Dictionary containing latest telemetry data
+            session: The session's Session, if the caller already looked it
+                up (skips the store lookup)
+
+        Raises:
+            KeyError: If session_id doesn't exist
+        """
+        if session is None:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError(f"Session {session_id} does not exist")
+
+        session.telemetry = telemetry
+        session.last_update = _utc_timestamp()
+        session.last_activity = time.monotonic()
+        session.telemetry_payload = {
+            'session_id': session_id,
+            'telemetry': telemetry
+        }
+
+    def mark_telemetry_pending(self, session_id: str) -> None:
+        """
+        Queue a session's latest telemetry for the next coalesced broadcast.
+
+        Marking a session that is already pending is a no-op, so a burst of
+        updates collapses into one broadcast of the newest telemetry.
+
+        Args:
+            session_id: The UUID of the session
+        """
+        self._pending_telemetry.add(session_id)
+
+    def drain_pending_telemetry(self) -> List[Session]:
+        """
+        Take every session with telemetry waiting to be broadcast.
+
+        Returns:
+            List of pending sessions that still exist (pending set is cleared)
+        """
+        pending, self._pending_telemetry = self._pending_telemetry, set()
+        sessions = self._sessions
+        return [sessions[sid] for sid in pending if sid in sessions]
+
+    def add_dashboard(self, session_id: str, sid: str) -> None:
+        """
+        Subscribe a dashboard client to a session's broadcasts.
+
+        Args:
+            session_id: The UUID of the session
+            sid: Socket.IO session ID of the dashboard client
 
         Raises:
             KeyError: If session_id doesn't exist
         """
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
             raise KeyError(f"Session {session_id} does not exist")
 
-        self._sessions[session_id]['telemetry'] = telemetry
-        self._sessions[session_id]['last_update'] = datetime.utcnow().isoformat()
+        session.dashboard_sids.add(sid)
+        self._dashboard_sessions.setdefault(sid, set()).add(session_id)
+
+    def remove_dashboard(self, sid: str) -> None:
+        """
+        Unsubscribe a dashboard client from every session it joined.
+
+        Args:
+            sid: Socket.IO session ID of the dashboard client
+
+        Note:
+            Silently succeeds if the client never joined a session
+        """
+        for session_id in self._dashboard_sessions.pop(sid, ()):
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.dashboard_sids.discard(sid)
 
     def delete_session(self, session_id: str) -> None:
         """
@@ -97,7 +286,46 @@ class SessionManager:
         Note:
             Silently succeeds if session doesn't exist
         """
-        self._sessions.pop(session_id, None)
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+
+        for sid in session.dashboard_sids:
+            joined = self._dashboard_sessions.get(sid)
+            if joined is not None:
+                joined.discard(session_id)
+                if not joined:
+                    del self._dashboard_sessions[sid]
+
+    def evict_idle_sessions(self, max_idle: float) -> List[str]:
+        """
+        Delete sessions with no monitor activity for longer than max_idle.
+
+        Bounds memory when monitors disappear without cleaning up. Sessions
+        that still have dashboards subscribed are kept, so a shared dashboard
+        URL keeps working while the monitor is quiet.
+
+        Args:
+            max_idle: Seconds since creation or the last setup/telemetry update
+
+        Returns:
+            List of deleted session IDs
+        """
+        cutoff = time.monotonic() - max_idle
+        # Snapshot: handlers may create sessions while the sweep runs
+        idle = [session_id for session_id, session in list(self._sessions.items())
+                if session.last_activity < cutoff and not session.dashboard_sids]
+        for session_id in idle:
+            self.delete_session(session_id)
+        return idle
+
+    def clear(self) -> None:
+        """
+        Delete every session, dashboard subscription and pending broadcast.
+        """
+        self._sessions.clear()
+        self._dashboard_sessions.clear()
+        self._pending_telemetry.clear()
 
     def get_active_sessions(self) -> List[str]:
         """
@@ -127,14 +355,11 @@ class SessionManager:
         if not isinstance(session_id, str):
             return False, "Session ID must be a string"
 
-        try:
-            parsed_uuid = uuid.UUID(session_id)
-            # Verify it's the same when converted back to string
-            if str(parsed_uuid) != session_id:
-                return False, "Session ID format is not normalized"
-            return True, None
-        except (ValueError, AttributeError, TypeError) as e:
-            return False, f"Invalid UUID format: {str(e)}"
+        # Reject wrong-length (including oversized) client input before it is
+        # hashed, so only UUID-sized strings ever reach the cache
+        if len(session_id) != 36:
+            return _INVALID_UUID
+        return _match_session_id(session_id)
 
     @staticmethod
     def construct_dashboard_url(session_id: str, host: str = 'localhost',
@@ -22,6 +22,10 @@ class Config:
     # Debug mode (True for development, False for production)
     DEBUG = os.environ.get('DEBUG', 'True') == 'True'
 
+    # Re-read templates on every request. Off by default, even with DEBUG, so
+    # /dashboard serves its cached page; set True while editing templates.
+    TEMPLATES_AUTO_RELOAD = os.environ.get('TEMPLATES_AUTO_RELOAD', 'False') == 'True'
+
     # Server host (0.0.0.0 allows external connections)
     HOST = os.environ.get('HOST', '0.0.0.0')
 
@@ -31,3 +35,27 @@ class Config:
     # CORS configuration for WebSocket connections
     # In production, you should restrict this to specific origins
     CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ORIGINS', '*')
+
+    # Flask-SocketIO async mode ('eventlet', 'gevent', 'threading').
+    # Unset picks the best installed one; run.py relies on eventlet.
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE') or None
+
+    # Comma-separated Engine.IO transports the server accepts. WebSocket only
+    # by default; 'polling,websocket' re-enables the polling-first handshake
+    # for monitors still on python-socketio's default transports.
+    SOCKETIO_TRANSPORTS = [
+        transport.strip()
+        for transport in os.environ.get('SOCKETIO_TRANSPORTS', 'websocket').split(',')
+        if transport.strip()
+    ]
+
+    # Seconds between coalesced telemetry broadcasts to dashboards.
+    # 0 sends every update immediately; e.g. 0.05 caps broadcasts at 20Hz per
+    # session, so monitor bursts (retries, reconnects) send only the latest.
+    TELEMETRY_BROADCAST_INTERVAL = float(os.environ.get('TELEMETRY_BROADCAST_INTERVAL', 0))
+
+    # Opt-in: sessions with no monitor activity for this many seconds and no
+    # subscribed dashboards are deleted. 0 (default) keeps sessions until the
+    # server restarts. Checked every SESSION_SWEEP_INTERVAL seconds.
+    SESSION_IDLE_TIMEOUT = float(os.environ.get('SESSION_IDLE_TIMEOUT', 0))
+    SESSION_SWEEP_INTERVAL = float(os.environ.get('SESSION_SWEEP_INTERVAL', 60))
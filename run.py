@@ -2,11 +2,18 @@
 Development server entry point for 1Lap Dashboard Server.
 
 Run this file directly to start the Flask development server with SocketIO support.
-For production, use gunicorn instead (see deployment configuration).
+For production, use gunicorn with a single eventlet worker:
+
+    gunicorn -k eventlet -w 1 run:app
 """
 
-from app import create_app, socketio
-from config import Config
+# Patch the standard library for cooperative I/O before anything else is
+# imported, so sockets, locks and sleeps yield to other greenlets
+import eventlet
+eventlet.monkey_patch()
+
+from app import create_app, socketio  # noqa: E402
+from config import Config  # noqa: E402
 
 # Create the Flask application
 app = create_app()
@@ -2,8 +2,8 @@
 let socket;
 
 function initDashboard(sessionId) {
-    // Connect to server
-    socket = io();
+    // Connect to server (WebSocket only; the server disables long-polling)
+    socket = io({transports: ['websocket']});
 
     socket.on('connect', () => {
         console.log('Connected to server');
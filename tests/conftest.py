@@ -22,8 +22,12 @@ Notes:
     - Some fixtures are skeletons/placeholders for features not yet implemented
     - These will be activated when Flask app and WebSocket server are complete
     - All fixtures use function scope (fresh instance per test) unless noted
+    - Sample data fixtures are session-scoped and shared; see DATA FIXTURES
 """
 
+import copy
+import functools
+import uuid
 import pytest
 from datetime import datetime, timezone
 
@@ -35,7 +39,7 @@ from datetime import datetime, timezone
 # They will be activated once the Flask app and WebSocket server are implemented.
 # ==============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     """
     Create and configure Flask application instance for testing.
@@ -49,12 +53,64 @@ def app():
             with app.app_context():
                 # Test something
                 pass
+
+    Notes:
+        - Created once per test run and shared by every test; under
+          pytest-xdist each worker is its own process, so it gets its own
+          app and session_manager
+        - Change app.config only through monkeypatch so it is restored
+        - Server-side sessions are cleared before each test (see below)
     """
     from app import create_app
-    app = create_app()
-    app.config['TESTING'] = True
-    app.config['SECRET_KEY'] = 'test-secret-key'
-    return app
+    return create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'test-secret-key',
+        # Test clients are in-process; skip eventlet's green scheduler
+        'SOCKETIO_ASYNC_MODE': 'threading',
+    })
+
+
+@pytest.fixture(autouse=True)
+def _reset_server_sessions():
+    """
+    Clear the server's global SessionManager before each test.
+
+    The app is shared across the run, so this keeps sessions and dashboard
+    subscriptions from one test out of the next.
+    """
+    from app.main import session_manager
+    session_manager.clear()
+
+
+@pytest.fixture
+def sio_clients(app):
+    """
+    Factory for SocketIO test clients that are disconnected after the test.
+
+    Args:
+        app: Flask application fixture
+
+    Returns:
+        Callable[[], SocketIOTestClient]: Creates a connected test client
+
+    Usage:
+        def test_broadcast(sio_clients):
+            monitor = sio_clients()
+            dashboard = sio_clients()
+    """
+    from app import socketio
+    clients = []
+
+    def connect():
+        client = socketio.test_client(app)
+        clients.append(client)
+        return client
+
+    yield connect
+
+    for client in clients:
+        if client.is_connected():
+            client.disconnect()
 
 
 @pytest.fixture
@@ -99,17 +155,185 @@ def socketio_client(app):
     return socketio.test_client(app)
 
 
+# ==============================================================================
+# SOCKETIO HELPERS
+# ==============================================================================
+
+def emit_many(client, event, payloads):
+    """
+    Emit the same event once per payload from a SocketIO test client.
+
+    Args:
+        client: SocketIOTestClient sending the events
+        event: Event name (e.g., 'telemetry_update')
+        payloads: Iterable of event payloads, sent in order
+
+    Usage:
+        emit_many(monitor, 'telemetry_update',
+                  [{'session_id': sid, 'telemetry': t} for t in series])
+    """
+    emit = client.emit
+    for payload in payloads:
+        emit(event, payload)
+
+
+def drain(client, namespace='/'):
+    """
+    Take every message a SocketIO test client has received, in O(n).
+
+    Same result as client.get_received(), which removes returned packets
+    with a list membership test per packet (quadratic for long bursts).
+
+    Args:
+        client: SocketIOTestClient to drain
+        namespace: Namespace to take messages from (default: '/')
+
+    Returns:
+        list: Received packets ({'name', 'args', 'namespace'}) in order
+    """
+    queue = client.queue
+    if not isinstance(queue, list):
+        # Unknown flask-socketio internals: use the public API
+        return client.get_received(namespace)
+    client.queue = [pkt for pkt in queue if pkt['namespace'] != namespace]
+    return [pkt for pkt in queue if pkt['namespace'] == namespace]
+
+
+def first_msg(received, name):
+    """
+    Return the first received message for an event, or None.
+
+    Args:
+        received: List from SocketIOTestClient.get_received()
+        name: Event name (e.g., 'telemetry_update')
+    """
+    return next((msg for msg in received if msg['name'] == name), None)
+
+
+def by_name(received):
+    """
+    Index received messages by event name in one pass.
+
+    Args:
+        received: List from SocketIOTestClient.get_received()
+
+    Returns:
+        dict: Event name -> message (the last one if a name repeats; use
+        count_msgs when the number of messages matters)
+    """
+    return {msg['name']: msg for msg in received}
+
+
+def count_msgs(received, name):
+    """
+    Count received messages for an event without building a filtered list.
+
+    Args:
+        received: List from SocketIOTestClient.get_received()
+        name: Event name (e.g., 'telemetry_update')
+    """
+    return sum(1 for msg in received if msg['name'] == name)
+
+
+def extract_sid(received):
+    """
+    Return the session ID from a drained 'request_session_id' reply.
+
+    Args:
+        received: List whose first message is 'session_id_assigned'
+    """
+    return received[0]['args'][0]['session_id']
+
+
+def extract_telemetry_lap(msg):
+    """
+    Return the lap number carried by a received 'telemetry_update' message.
+
+    Args:
+        msg: One message dict from a received list
+    """
+    return msg['args'][0]['telemetry']['lap']
+
+
+def join_silent(client, session_id):
+    """
+    Join a session and discard whatever the join replays (setup/telemetry).
+
+    Args:
+        client: Connected SocketIOTestClient acting as a dashboard
+        session_id: Session to join
+    """
+    client.emit('join_session', {'session_id': session_id})
+    drain(client)
+
+
+def spawn_dashboard(sio_clients, session_id):
+    """
+    Connect a dashboard client, join a session and discard the join replay.
+
+    Args:
+        sio_clients: The sio_clients fixture (client factory)
+        session_id: Session to join
+
+    Returns:
+        SocketIOTestClient: Joined dashboard with an empty receive queue
+    """
+    dashboard = sio_clients()
+    join_silent(dashboard, session_id)
+    return dashboard
+
+
+@pytest.fixture
+def monitor_session(sio_clients):
+    """
+    Monitor client that has already been assigned a session.
+
+    Returns:
+        tuple: (SocketIOTestClient, session_id) with an empty receive queue
+
+    Usage:
+        def test_setup(monitor_session):
+            monitor, session_id = monitor_session
+    """
+    monitor = sio_clients()
+    monitor.emit('request_session_id', {})
+    return monitor, extract_sid(drain(monitor))
+
+
+@pytest.fixture
+def dashboard_factory(sio_clients):
+    """
+    Factory for dashboards that have joined a session.
+
+    Returns:
+        Callable[[str], SocketIOTestClient]: make(session_id), see spawn_dashboard
+
+    Usage:
+        def test_broadcast(monitor_session, dashboard_factory):
+            monitor, session_id = monitor_session
+            dashboard = dashboard_factory(session_id)
+    """
+    return functools.partial(spawn_dashboard, sio_clients)
+
+
 # ==============================================================================
 # COMPONENT FIXTURES (SessionManager, etc.)
 # ==============================================================================
 
+@pytest.fixture(scope="session")
+def _shared_session_manager():
+    """Single SessionManager reused by every test (see session_manager)."""
+    from app.session_manager import SessionManager
+    return SessionManager()
+
+
 @pytest.fixture
-def session_manager():
+def session_manager(_shared_session_manager):
     """
-    Create a fresh SessionManager instance for testing.
+    Provide an empty SessionManager instance for testing.
 
     Returns:
-        SessionManager: New instance with empty sessions dict
+        SessionManager: Instance with no sessions or dashboard subscriptions
 
     Status: ACTIVE - SessionManager is implemented
     Usage:
@@ -118,25 +342,108 @@ def session_manager():
             assert isinstance(session_id, str)
 
     Notes:
-        - Each test gets a fresh instance (function scope)
+        - One instance is built per test run and cleared before each test
         - No shared state between tests
-        - Safe for parallel test execution
+        - Safe for parallel test execution (one instance per xdist worker)
     """
-    from app.session_manager import SessionManager
-    return SessionManager()
+    _shared_session_manager.clear()
+    return _shared_session_manager
 
 
 # ==============================================================================
 # DATA FIXTURES (Sample telemetry, setup, etc.)
 # ==============================================================================
+# The sample payloads are built once at import. The plain fixtures are
+# session-scoped and hand every test the same dict, so treat them as
+# read-only (checked after every test); tests that need to modify a
+# payload work on a copy.deepcopy() of it.
+# ==============================================================================
 
-@pytest.fixture
+# Fixture name -> (shared dict, deep-copied snapshot), filled as fixtures are built
+_SHARED_SAMPLES = {}
+
+
+def _share_sample(name, data):
+    """Register a shared sample dict for the per-test mutation check."""
+    _SHARED_SAMPLES[name] = (data, copy.deepcopy(data))
+    return data
+
+
+@pytest.fixture(autouse=True)
+def _check_shared_samples():
+    """
+    Fail the test that modified a shared sample payload, then restore it.
+
+    Runs after every test, so the error is reported against the test that
+    made the change and later tests still get the original data.
+    """
+    yield
+    modified = []
+    for name, (data, snapshot) in _SHARED_SAMPLES.items():
+        if data != snapshot:
+            data.clear()
+            data.update(copy.deepcopy(snapshot))
+            modified.append(name)
+    if modified:
+        pytest.fail(f"Test modified the shared {', '.join(modified)}; deep-copy it first")
+
+_SETUP_TEMPLATE = {
+    "suspension": {
+        "front_spring_rate": 120.5,
+        "rear_spring_rate": 115.3,
+        "front_damper": 8,
+        "rear_damper": 7
+    },
+    "aerodynamics": {
+        "front_wing": 5,
+        "rear_wing": 8
+    },
+    "brakes": {
+        "brake_bias": 56.5
+    }
+}
+
+# 'timestamp' is added when the telemetry fixture is first requested
+_TELEMETRY_TEMPLATE = {
+    "lap": 5,
+    "position": 2,
+    "fuel": 45.3,
+    "fuel_capacity": 80.0,
+    "tire_pressures": {
+        "fl": 28.5,
+        "fr": 28.7,
+        "rl": 27.8,
+        "rr": 28.0
+    },
+    "tire_temps": {
+        "fl": 85.2,
+        "fr": 86.1,
+        "rl": 84.5,
+        "rr": 85.0
+    },
+    "brake_temps": {
+        "fl": 450.0,
+        "fr": 455.0,
+        "rl": 420.0,
+        "rr": 425.0
+    },
+    "engine_water_temp": 92.5,
+    "track_temp": 28.5,
+    "ambient_temp": 22.0,
+    "player_name": "Test Driver",
+    "car_name": "Test Car",
+    "track_name": "Test Track",
+    "session_type": "race"
+}
+
+
+@pytest.fixture(scope="session")
 def sample_setup_data():
     """
     Sample car setup data from LMU REST API.
 
     Returns:
-        dict: Car setup with suspension, aero, brakes
+        dict: Car setup with suspension, aero, brakes (shared, read-only)
 
     Structure:
         {
@@ -149,31 +456,21 @@ def sample_setup_data():
         def test_setup_storage(session_manager, sample_setup_data):
             session_id = session_manager.create_session()
             session_manager.update_setup(session_id, sample_setup_data, timestamp)
+
+    Notes:
+        - Same dict for every test; deep-copy it before modifying
+        - A test that modifies it fails, and the dict is restored
     """
-    return {
-        "suspension": {
-            "front_spring_rate": 120.5,
-            "rear_spring_rate": 115.3,
-            "front_damper": 8,
-            "rear_damper": 7
-        },
-        "aerodynamics": {
-            "front_wing": 5,
-            "rear_wing": 8
-        },
-        "brakes": {
-            "brake_bias": 56.5
-        }
-    }
+    return _share_sample('sample_setup_data', _SETUP_TEMPLATE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_telemetry_data():
     """
     Sample telemetry data from monitor (shared memory).
 
     Returns:
-        dict: Real-time telemetry with fuel, tires, temps, etc.
+        dict: Real-time telemetry with fuel, tires, temps, etc. (shared, read-only)
 
     Structure:
         {
@@ -192,39 +489,50 @@ def sample_telemetry_data():
             session_manager.update_telemetry(session_id, sample_telemetry_data)
 
     Notes:
-        - Timestamp is dynamically generated per test
+        - Timestamp is generated once, when first requested in the test run
         - Values are realistic racing data
         - Matches expected structure from monitor
+        - Same dict for every test; deep-copy it before modifying
+        - A test that modifies it fails, and the dict is restored
     """
-    return {
+    return _share_sample('sample_telemetry_data', {
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "lap": 5,
-        "position": 2,
-        "fuel": 45.3,
-        "fuel_capacity": 80.0,
-        "tire_pressures": {
-            "fl": 28.5,
-            "fr": 28.7,
-            "rl": 27.8,
-            "rr": 28.0
-        },
-        "tire_temps": {
-            "fl": 85.2,
-            "fr": 86.1,
-            "rl": 84.5,
-            "rr": 85.0
-        },
-        "brake_temps": {
-            "fl": 450.0,
-            "fr": 455.0,
-            "rl": 420.0,
-            "rr": 425.0
-        },
-        "engine_water_temp": 92.5,
-        "track_temp": 28.5,
-        "ambient_temp": 22.0,
-        "player_name": "Test Driver",
-        "car_name": "Test Car",
-        "track_name": "Test Track",
-        "session_type": "race"
-    }
+        **_TELEMETRY_TEMPLATE
+    })
+
+
+@pytest.fixture(scope="session")
+def fuel_series_10():
+    """
+    Ten laps of telemetry with fuel dropping 2.5L per lap from 80L.
+
+    Returns:
+        list: generate_fuel_series(start_fuel=80.0, fuel_per_lap=2.5, num_laps=10)
+
+    Notes:
+        - Built once per test run and shared (read-only)
+    """
+    from tests.test_data import generate_fuel_series
+    return generate_fuel_series(start_fuel=80.0, fuel_per_lap=2.5, num_laps=10)
+
+
+@pytest.fixture(scope="session")
+def iso_now():
+    """
+    One ISO 8601 UTC timestamp for tests that just need a valid timestamp.
+
+    Returns:
+        str: datetime.now(timezone.utc).isoformat(), taken once per test run
+    """
+    return datetime.now(timezone.utc).isoformat()
+
+
+@pytest.fixture(scope="session")
+def sample_session_id():
+    """
+    One well-formed session ID for tests that don't create a session.
+
+    Returns:
+        str: Canonical UUID4 string, generated once per test run
+    """
+    return str(uuid.uuid4())
@@ -0,0 +1,38 @@
+"""
+Microbenchmarks for hot server paths (requires pytest-benchmark).
+
+Running Benchmarks:
+    pytest tests/test_benchmarks.py --benchmark-columns=mean,median,stddev,ops
+
+    # Compare against a saved baseline
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare
+
+Notes:
+    - Skipped when pytest-benchmark is not installed
+    - pytest-benchmark disables itself under pytest-xdist (-n); run these
+      serially for meaningful numbers
+"""
+
+import pytest
+
+from tests.conftest import drain, extract_sid, spawn_dashboard
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.slow
+def test_telemetry_broadcast_roundtrip(benchmark, sio_clients, sample_telemetry_data):
+    """Time one telemetry_update from monitor emit to dashboard receipt."""
+    monitor = sio_clients()
+    monitor.emit('request_session_id', {})
+    session_id = extract_sid(drain(monitor))
+    dashboard = spawn_dashboard(sio_clients, session_id)
+    payload = {'session_id': session_id, 'telemetry': sample_telemetry_data}
+
+    def roundtrip():
+        monitor.emit('telemetry_update', payload)
+        return drain(dashboard)
+
+    received = benchmark.pedantic(roundtrip, rounds=100, warmup_rounds=10)
+    assert [msg['name'] for msg in received] == ['telemetry_update']
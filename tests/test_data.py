@@ -24,16 +24,118 @@ Features:
     - Type-safe data structures
 
 Notes:
-    - All generators return dict (not classes/objects)
-    - Timestamps use ISO 8601 format (UTC)
+    - Generators return dicts, except generate_websocket_message (WSMessage,
+      a read-only mapping)
+    - Timestamps use ISO 8601 format (UTC, millisecond precision)
     - Tire data uses standard abbreviations (fl, fr, rl, rr)
     - Temperature values in Celsius
     - Pressure values in PSI
     - Fuel values in liters
 """
 
+import os
+import sys
+import time
+import uuid
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional
+
+# (millisecond bucket, ISO string) of the last generated timestamp
+_TS_CACHE = (None, None)
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string at millisecond precision.
+
+    The string is interned and reused within the same millisecond, so
+    timestamps generated together share one object.
+
+    Returns:
+        str: e.g. '2025-11-22T14:30:00.123+00:00'
+    """
+    global _TS_CACHE
+    bucket = time.monotonic_ns() // 1_000_000
+    cached_bucket, cached = _TS_CACHE
+    if bucket != cached_bucket:
+        cached = sys.intern(datetime.now(timezone.utc).isoformat(timespec='milliseconds'))
+        _TS_CACHE = (bucket, cached)
+    return cached
+
+
+# Default tire/brake readings. Generated telemetry gets its own copies unless
+# shared=True is passed, in which case these dicts must not be modified.
+_TIRE_PRESSURES = {
+    'fl': 28.5,  # Front-left
+    'fr': 28.7,  # Front-right
+    'rl': 27.8,  # Rear-left
+    'rr': 28.0   # Rear-right
+}
+
+_TIRE_TEMPS = {
+    'fl': 85.2,  # Celsius
+    'fr': 86.1,
+    'rl': 84.5,
+    'rr': 85.0
+}
+
+_BRAKE_TEMPS = {
+    'fl': 450.0,  # Celsius
+    'fr': 455.0,
+    'rl': 420.0,
+    'rr': 425.0
+}
+
+# Telemetry keys holding the nested dicts above
+_NESTED_TELEMETRY_KEYS = ('tire_pressures', 'tire_temps', 'brake_temps')
+
+# Fixed telemetry fields; generate_telemetry copies this and fills in the rest.
+_TELEMETRY_DEFAULTS = {
+    'timestamp': None,
+    'lap': None,
+    'position': None,
+    'lap_time': 123.456,  # Lap time in seconds
+    'fuel': None,
+    'fuel_capacity': None,
+    'tire_pressures': _TIRE_PRESSURES,
+    'tire_temps': _TIRE_TEMPS,
+    'brake_temps': _BRAKE_TEMPS,
+    'engine_water_temp': 92.5,  # Celsius
+    'engine_oil_temp': 105.0,   # Celsius
+    'track_temp': 28.5,  # Celsius
+    'ambient_temp': 22.0,  # Celsius
+    'player_name': None,
+    'car_name': None,
+    'track_name': None,
+    'session_type': None,
+    'speed': 180.5,  # km/h
+    'rpm': 7500,
+    'gear': 4,
+}
+
+
+def _session_ids(count: int) -> list:
+    """
+    Generate random UUID4 strings from a single os.urandom() read.
+
+    Canonical dashed form, so the IDs pass SessionManager.validate_session_id().
+    """
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _copy_telemetry(telemetry: Dict[str, Any], shared: bool) -> Dict[str, Any]:
+    """
+    Copy a telemetry dict, also copying the nested tire/brake dicts unless shared.
+
+    The nested dicts only hold floats, so one dict copy each is a full deep copy.
+    """
+    data = telemetry.copy()
+    if not shared:
+        for key in _NESTED_TELEMETRY_KEYS:
+            data[key] = data[key].copy()
+    return data
 
 
 def generate_telemetry(
@@ -45,6 +147,7 @@ def generate_telemetry(
     car_name: str = "Test Car",
     track_name: str = "Test Track",
     session_type: str = "race",
+    shared: bool = False,
     **overrides: Any
 ) -> Dict[str, Any]:
     """
@@ -59,6 +162,8 @@ def generate_telemetry(
         car_name: Car/vehicle name (default: "Test Car")
         track_name: Track/circuit name (default: "Test Track")
         session_type: Session type (e.g., "practice", "qualifying", "race")
+        shared: Reference the module-level tire/brake dicts instead of
+            copying them; they must then not be modified (default: False)
         **overrides: Any additional fields to override
 
     Returns:
@@ -79,50 +184,53 @@ def generate_telemetry(
         - Timestamp is auto-generated (UTC)
         - Tire temps/pressures use realistic values
         - All temps in Celsius, pressures in PSI
+        - Built by copying _TELEMETRY_DEFAULTS; tire_pressures, tire_temps
+          and brake_temps are copied too unless shared=True
     """
-    data = {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
-        'lap': lap,
-        'position': position,
-        'lap_time': 123.456,  # Lap time in seconds
-        'fuel': fuel,
-        'fuel_capacity': fuel_capacity,
-        'tire_pressures': {
-            'fl': 28.5,  # Front-left
-            'fr': 28.7,  # Front-right
-            'rl': 27.8,  # Rear-left
-            'rr': 28.0   # Rear-right
-        },
-        'tire_temps': {
-            'fl': 85.2,  # Celsius
-            'fr': 86.1,
-            'rl': 84.5,
-            'rr': 85.0
-        },
-        'brake_temps': {
-            'fl': 450.0,  # Celsius
-            'fr': 455.0,
-            'rl': 420.0,
-            'rr': 425.0
-        },
-        'engine_water_temp': 92.5,  # Celsius
-        'engine_oil_temp': 105.0,   # Celsius
-        'track_temp': 28.5,  # Celsius
-        'ambient_temp': 22.0,  # Celsius
-        'player_name': player_name,
-        'car_name': car_name,
-        'track_name': track_name,
-        'session_type': session_type,
-        'speed': 180.5,  # km/h
-        'rpm': 7500,
-        'gear': 4,
-    }
+    data = _copy_telemetry(_TELEMETRY_DEFAULTS, shared)
+    # Explicit timestamp overrides skip generating one
+    data['timestamp'] = overrides['timestamp'] if 'timestamp' in overrides else _now_iso()
+    data['lap'] = lap
+    data['position'] = position
+    data['fuel'] = fuel
+    data['fuel_capacity'] = fuel_capacity
+    data['player_name'] = player_name
+    data['car_name'] = car_name
+    data['track_name'] = track_name
+    data['session_type'] = session_type
 
     # Apply any overrides
     data.update(overrides)
     return data
 
 
+# Default setup values, copied (and merged with overrides) by generate_setup()
+_DEFAULT_SUSPENSION = {
+    'front_spring_rate': 120.5,  # N/mm
+    'rear_spring_rate': 115.3,   # N/mm
+    'front_damper': 8,  # Clicks
+    'rear_damper': 7,   # Clicks
+    'front_anti_roll_bar': 6,
+    'rear_anti_roll_bar': 5,
+    'front_ride_height': 45.0,  # mm
+    'rear_ride_height': 55.0    # mm
+}
+
+_DEFAULT_AERODYNAMICS = {
+    'front_wing': 5,  # Clicks/settings
+    'rear_wing': 8,
+    'front_splitter': 3,
+    'rear_diffuser': 4
+}
+
+_DEFAULT_BRAKES = {
+    'brake_bias': 56.5,  # % front
+    'brake_pressure': 85.0,  # %
+    'front_brake_duct': 2,  # Clicks
+    'rear_brake_duct': 2
+}
+
+
 def generate_setup(
     suspension: Optional[Dict[str, Any]] = None,
     aerodynamics: Optional[Dict[str, Any]] = None,
@@ -160,45 +268,13 @@ def generate_setup(
         - Values are realistic for GT3/LMP2 cars
         - Spring rates in N/mm, dampers in clicks
     """
-    # Default setup values
-    default_suspension = {
-        'front_spring_rate': 120.5,  # N/mm
-        'rear_spring_rate': 115.3,   # N/mm
-        'front_damper': 8,  # Clicks
-        'rear_damper': 7,   # Clicks
-        'front_anti_roll_bar': 6,
-        'rear_anti_roll_bar': 5,
-        'front_ride_height': 45.0,  # mm
-        'rear_ride_height': 55.0    # mm
-    }
-
-    default_aerodynamics = {
-        'front_wing': 5,  # Clicks/settings
-        'rear_wing': 8,
-        'front_splitter': 3,
-        'rear_diffuser': 4
-    }
-
-    default_brakes = {
-        'brake_bias': 56.5,  # % front
-        'brake_pressure': 85.0,  # %
-        'front_brake_duct': 2,  # Clicks
-        'rear_brake_duct': 2
-    }
-
-    # Merge provided overrides with defaults
-    if suspension:
-        default_suspension.update(suspension)
-    if aerodynamics:
-        default_aerodynamics.update(aerodynamics)
-    if brakes:
-        default_brakes.update(brakes)
-
-    # Build complete setup
     data = {
-        'suspension': default_suspension,
-        'aerodynamics': default_aerodynamics,
-        'brakes': default_brakes
+        'suspension': ({**_DEFAULT_SUSPENSION, **suspension} if suspension
+                       else _DEFAULT_SUSPENSION.copy()),
+        'aerodynamics': ({**_DEFAULT_AERODYNAMICS, **aerodynamics} if aerodynamics
+                         else _DEFAULT_AERODYNAMICS.copy()),
+        'brakes': ({**_DEFAULT_BRAKES, **brakes} if brakes
+                   else _DEFAULT_BRAKES.copy()),
     }
 
     # Apply any top-level overrides
@@ -210,6 +286,7 @@ def generate_session_data(
     session_id: Optional[str] = None,
     with_setup: bool = True,
     with_telemetry: bool = True,
+    shared: bool = False,
     **kwargs: Any
 ) -> Dict[str, Any]:
     """
@@ -219,6 +296,8 @@ def generate_session_data(
         session_id: Session UUID (auto-generated if None)
         with_setup: Include setup data (default: True)
         with_telemetry: Include telemetry data (default: True)
+        shared: Reference the module-level nested telemetry dicts instead of
+            copying them; they must then not be modified (default: False)
         **kwargs: Pass-through to telemetry/setup generators
 
     Returns:
@@ -239,34 +318,112 @@ def generate_session_data(
 
     Notes:
         - Mimics SessionManager.get_session() return structure
+        - created_at, last_update, setup_timestamp and the telemetry
+          timestamp share one value
+        - Every session gets its own setup dict
         - Useful for integration testing
     """
-    import uuid
-
     if session_id is None:
-        session_id = str(uuid.uuid4())
+        session_id = _session_ids(1)[0]
+
+    return _build_session(session_id, _now_iso(), with_setup, with_telemetry, shared, **kwargs)
 
+
+def _build_session(
+    session_id: str,
+    ts: str,
+    with_setup: bool,
+    with_telemetry: bool,
+    shared: bool = False,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Build a session data dict with every timestamp field set to ts.
+
+    Shared by generate_session_data() and generate_multi_session(), which
+    supply the ID and timestamp up front.
+    """
     data = {
         'session_id': session_id,
-        'created_at': datetime.now(timezone.utc).isoformat(),
-        'last_update': datetime.now(timezone.utc).isoformat(),
+        'created_at': ts,
+        'last_update': ts,
     }
 
     if with_setup:
         data['setup'] = generate_setup()
-        data['setup_timestamp'] = datetime.now(timezone.utc).isoformat()
+        data['setup_timestamp'] = ts
 
     if with_telemetry:
-        data['telemetry'] = generate_telemetry(**kwargs)
+        kwargs.setdefault('timestamp', ts)
+        data['telemetry'] = generate_telemetry(shared=shared, **kwargs)
 
     return data
 
 
+# Keys WSMessage serves from its own fields rather than the payload
+_WS_ENVELOPE_KEYS = frozenset(('event', 'session_id'))
+
+
+class WSMessage(Mapping):
+    """
+    WebSocket message for testing: event name, session ID and payload fields.
+
+    A read-only mapping with the same keys as the flat dict it replaces
+    ('event', 'session_id', then payload keys), so msg['key'], 'key' in msg
+    and dict(msg) all work. Not JSON-serializable itself, so sending it by
+    mistake fails loudly; use to_dict() for emit()/JSON.
+
+    Attributes:
+        event: Event name (e.g., 'telemetry_update')
+        session_id: Session UUID
+        payload: Event-specific data fields
+    """
+
+    __slots__ = ('event', 'session_id', 'payload')
+
+    def __init__(self, event: str, session_id: str, payload: Optional[Dict[str, Any]] = None):
+        self.event = event
+        self.session_id = session_id
+        self.payload = payload if payload is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'event':
+            return self.event
+        if key == 'session_id':
+            return self.session_id
+        return self.payload[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield 'event'
+        yield 'session_id'
+        for key in self.payload:
+            if key not in _WS_ENVELOPE_KEYS:
+                yield key
+
+    def __len__(self) -> int:
+        return 2 + sum(1 for key in self.payload if key not in _WS_ENVELOPE_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _WS_ENVELOPE_KEYS or key in self.payload
+
+    def __repr__(self) -> str:
+        return f'WSMessage({self.event!r}, {self.session_id!r}, {self.payload!r})'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Flatten into the plain dict sent over the wire.
+
+        Returns:
+            dict: {'event': ..., 'session_id': ..., **payload}
+        """
+        return dict(self.items())
+
+
 def generate_websocket_message(
     event: str,
     session_id: str,
     data: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
+) -> WSMessage:
     """
     Generate WebSocket message payload for testing.
 
@@ -276,7 +433,7 @@ def generate_websocket_message(
         data: Event-specific data payload
 
     Returns:
-        dict: WebSocket message structure
+        WSMessage: WebSocket message structure
 
     Example:
         >>> msg = generate_websocket_message(
@@ -284,6 +441,7 @@ def generate_websocket_message(
         ...     'abc-123',
         ...     {'telemetry': generate_telemetry()}
         ... )
+        >>> assert msg.event == msg['event'] == 'telemetry_update'
 
         >>> msg = generate_websocket_message(
         ...     'setup_data',
@@ -293,27 +451,65 @@ def generate_websocket_message(
         ...         'timestamp': datetime.now(timezone.utc).isoformat()
         ...     }
         ... )
+        >>> payload = msg.to_dict()
 
     Notes:
         - Matches expected WebSocket event structure
         - Useful for testing event handlers
+        - The data dict is stored as the payload, not copied
     """
-    message = {
-        'event': event,
-        'session_id': session_id,
-    }
+    return WSMessage(event, session_id, data if data else {})
 
-    if data:
-        message.update(data)
 
-    return message
+def _fuel_levels(start_fuel: float, fuel_per_lap: float, num_laps: int) -> list:
+    """Fuel at the start of each lap, never below zero."""
+    # Conditional expression rather than max(): no builtin call per lap
+    return [fuel if (fuel := start_fuel - n * fuel_per_lap) > 0.0 else 0.0
+            for n in range(num_laps)]
+
+
+def generate_fuel_series_iter(
+    start_fuel: float = 80.0,
+    fuel_per_lap: float = 2.5,
+    num_laps: int = 10,
+    capacity: float = 80.0,
+    shared: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield telemetry dicts showing fuel consumption, one lap at a time.
+
+    Args:
+        start_fuel: Starting fuel in liters (default: 80.0)
+        fuel_per_lap: Fuel consumed per lap (default: 2.5)
+        num_laps: Number of laps to generate (default: 10)
+        capacity: Fuel tank capacity (default: 80.0)
+        shared: Reference one set of nested tire/brake dicts from every row
+            instead of copying them; they must then not be modified
+            (default: False)
+
+    Yields:
+        dict: Telemetry for the next lap
+
+    Notes:
+        - One telemetry dict is generated and copied per lap; only 'lap'
+          and 'fuel' differ between rows (timestamps are identical)
+        - Each row has its own nested tire/brake dicts unless shared=True
+    """
+    base = generate_telemetry(fuel_capacity=capacity)
+
+    for lap_num, fuel in enumerate(_fuel_levels(start_fuel, fuel_per_lap, num_laps), 1):
+        row = _copy_telemetry(base, shared)
+        row['lap'] = lap_num
+        row['fuel'] = fuel
+        yield row
 
 
 def generate_fuel_series(
     start_fuel: float = 80.0,
     fuel_per_lap: float = 2.5,
     num_laps: int = 10,
-    capacity: float = 80.0
+    capacity: float = 80.0,
+    shared: bool = False
 ) -> list:
     """
     Generate a series of telemetry data showing fuel consumption.
@@ -323,6 +519,9 @@ def generate_fuel_series(
         fuel_per_lap: Fuel consumed per lap (default: 2.5)
         num_laps: Number of laps to generate (default: 10)
         capacity: Fuel tank capacity (default: 80.0)
+        shared: Reference one set of nested tire/brake dicts from every row
+            instead of copying them; they must then not be modified
+            (default: False)
 
     Returns:
         list: List of telemetry dicts showing fuel progression
@@ -341,28 +540,19 @@ def generate_fuel_series(
         - Useful for testing fuel calculations
         - Each lap decreases fuel linearly
         - Returns complete telemetry (not just fuel values)
+        - Collects generate_fuel_series_iter(); use that to stream rows
     """
-    series = []
-    current_fuel = start_fuel
+    return list(generate_fuel_series_iter(start_fuel, fuel_per_lap, num_laps, capacity, shared))
 
-    for lap_num in range(1, num_laps + 1):
-        telemetry = generate_telemetry(
-            lap=lap_num,
-            fuel=max(0.0, current_fuel),
-            fuel_capacity=capacity
-        )
-        series.append(telemetry)
-        current_fuel -= fuel_per_lap
 
-    return series
-
-
-def generate_multi_session(num_sessions: int = 3) -> list:
+def generate_multi_session(num_sessions: int = 3, shared: bool = False) -> list:
     """
     Generate multiple session data structures.
 
     Args:
         num_sessions: Number of sessions to generate (default: 3)
+        shared: Share the nested telemetry dicts between sessions instead
+            of copying them (default: False)
 
     Returns:
         list: List of complete session data dicts
@@ -378,12 +568,9 @@ def generate_multi_session(num_sessions: int = 3) -> list:
         - Each session has unique UUID
         - Useful for testing concurrent sessions
         - All sessions have full setup + telemetry
+        - All sessions share one timestamp
+        - Each session has its own setup dict
     """
-    import uuid
-
-    sessions = []
-    for _ in range(num_sessions):
-        session_id = str(uuid.uuid4())
-        sessions.append(generate_session_data(session_id=session_id))
-
-    return sessions
+    ts = _now_iso()
+    session_ids = _session_ids(num_sessions)
+    return [_build_session(session_id, ts, True, True, shared) for session_id in session_ids]
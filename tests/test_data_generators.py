@@ -0,0 +1,109 @@
+"""
+Unit tests for the test data generators in tests/test_data.py.
+
+Checks that generated payloads are independent of each other unless
+sharing is requested explicitly, and that WSMessage keeps the flat message
+shape.
+"""
+
+import json
+
+import pytest
+
+from tests.test_data import (
+    generate_fuel_series,
+    generate_fuel_series_iter,
+    generate_multi_session,
+    generate_setup,
+    generate_telemetry,
+    generate_websocket_message
+)
+
+
+@pytest.mark.unit
+def test_generated_telemetry_nested_dicts_are_independent():
+    """Test that modifying one payload's tire data leaves later payloads intact."""
+    first = generate_telemetry()
+    first['tire_pressures']['fl'] = 0.0
+
+    second = generate_telemetry()
+    assert second['tire_pressures']['fl'] == 28.5
+    assert second['tire_temps'] is not first['tire_temps']
+
+
+@pytest.mark.unit
+def test_generated_telemetry_shared_opt_in():
+    """Test that shared=True references one set of nested dicts."""
+    first = generate_telemetry(shared=True)
+    second = generate_telemetry(shared=True)
+
+    assert first['brake_temps'] is second['brake_temps']
+    assert first['brake_temps'] == generate_telemetry()['brake_temps']
+
+
+@pytest.mark.unit
+def test_generated_sessions_have_independent_setups():
+    """Test that modifying one generated session's setup leaves the others intact."""
+    first, second = generate_multi_session(2, shared=True)
+    first['setup']['brakes']['brake_bias'] = 50.0
+
+    assert second['setup']['brakes']['brake_bias'] == 56.5
+    assert generate_multi_session(1)[0]['setup']['brakes']['brake_bias'] == 56.5
+
+
+@pytest.mark.unit
+def test_fuel_series_iter_matches_list():
+    """Test that the streaming and list fuel series yield the same rows."""
+    streamed = list(generate_fuel_series_iter(start_fuel=10.0, fuel_per_lap=4.0, num_laps=4))
+    series = generate_fuel_series(start_fuel=10.0, fuel_per_lap=4.0, num_laps=4)
+
+    # Timestamps come from separate calls and may differ by a millisecond
+    for row in streamed + series:
+        del row['timestamp']
+    assert streamed == series
+    assert [(row['lap'], row['fuel']) for row in series] == \
+        [(1, 10.0), (2, 6.0), (3, 2.0), (4, 0.0)]
+    assert series[0]['tire_temps'] is not series[1]['tire_temps']
+
+
+@pytest.mark.unit
+def test_websocket_message_is_flat_mapping():
+    """Test that WSMessage behaves like the flat message dict it replaces."""
+    msg = generate_websocket_message('telemetry_update', 'abc-123', {'telemetry': {'lap': 3}})
+    flat = {'event': 'telemetry_update', 'session_id': 'abc-123', 'telemetry': {'lap': 3}}
+
+    assert msg.to_dict() == dict(msg) == flat
+    assert msg == flat
+    assert 'telemetry' in msg and 'setup' not in msg
+    assert len(msg) == 3
+    assert msg['session_id'] == 'abc-123'
+    # Must be flattened explicitly; no silent nested encoding
+    with pytest.raises(TypeError):
+        json.dumps(msg)
+
+
+
+@pytest.mark.unit
+def test_websocket_message_emitted_payload_shape(app):
+    """Test that an emitted to_dict() payload is encoded in the flat wire shape."""
+    from socketio.packet import EVENT
+    from app import socketio
+
+    setup = generate_setup()
+    msg = generate_websocket_message('setup_data', 'abc-123', {
+        'setup': setup,
+        'timestamp': '2025-11-22T14:30:00+00:00'
+    })
+    # Encoded exactly as the server encodes an emit(), with the app's codec
+    packet_class = socketio.server.packet_class
+    encoded = packet_class(EVENT, data=[msg.event, msg.to_dict()]).encode()
+
+    assert encoded.startswith('2')
+    assert json.loads(encoded[1:]) == ['setup_data', {
+        'event': 'setup_data',
+        'session_id': 'abc-123',
+        'setup': setup,
+        'timestamp': '2025-11-22T14:30:00+00:00'
+    }]
+    with pytest.raises(TypeError):
+        packet_class(EVENT, data=[msg.event, msg]).encode()
@@ -17,8 +17,7 @@ def app():
     from app import create_app
 
     # Create app with test configuration
-    app = create_app()
-    app.config['TESTING'] = True
+    app = create_app({'TESTING': True, 'SOCKETIO_ASYNC_MODE': 'threading'})
 
     yield app
 
@@ -51,6 +50,15 @@ def test_app_creation():
     assert hasattr(app, 'route')
 
 
+@pytest.mark.unit
+def test_create_app_applies_test_config(app):
+    """Test that create_app() applies overrides before initialising SocketIO."""
+    from app import socketio
+
+    assert app.config['TESTING'] is True
+    assert socketio.async_mode == 'threading'
+
+
 @pytest.mark.unit
 def test_config_loading(app):
     """Test that configuration loads correctly from config.py."""
@@ -121,6 +129,156 @@ def test_socketio_initialized(app):
     assert hasattr(socketio, 'server')
 
 
+@pytest.mark.unit
+def test_socketio_orjson_codec():
+    """Test that the orjson codec round-trips Socket.IO payloads as str."""
+    pytest.importorskip('orjson')
+    from app import OrjsonCodec
+
+    payload = {'session_id': 'abc', 'telemetry': {'lap': 5, 'fuel': 45.3}}
+    encoded = OrjsonCodec.dumps(payload, separators=(',', ':'))
+
+    assert isinstance(encoded, str)
+    assert OrjsonCodec.loads(encoded) == payload
+
+
+@pytest.mark.unit
+def test_socketio_orjson_codec_accepts_nan():
+    """Test that packets with NaN/Infinity from stdlib-json clients still decode."""
+    import json
+    import math
+    pytest.importorskip('orjson')
+    from app import OrjsonCodec
+
+    encoded = json.dumps({'fuel': float('nan'), 'lap_time': float('inf')})
+    decoded = OrjsonCodec.loads(encoded)
+
+    assert math.isnan(decoded['fuel'])
+    assert decoded['lap_time'] == float('inf')
+    with pytest.raises(ValueError):
+        OrjsonCodec.loads('{"fuel": ')
+
+
+@pytest.mark.unit
+def test_socketio_websocket_only(app):
+    """Test that the Socket.IO server only accepts the WebSocket transport."""
+    from app import socketio
+
+    assert socketio.server.eio.transports == ['websocket']
+    assert socketio.server.eio.allow_upgrades is False
+
+
+@pytest.mark.unit
+def test_socketio_transports_configurable():
+    """Test that SOCKETIO_TRANSPORTS can re-enable the polling handshake."""
+    from app import create_app, socketio
+
+    create_app({
+        'TESTING': True,
+        'SOCKETIO_ASYNC_MODE': 'threading',
+        'SOCKETIO_TRANSPORTS': ['polling', 'websocket'],
+    })
+
+    assert socketio.server.eio.transports == ['polling', 'websocket']
+    assert socketio.server.eio.allow_upgrades is True
+
+
+class _StopTask(Exception):
+    """Raised by the patched socketio.sleep to end a background task loop."""
+
+
+def _capture_background_tasks(monkeypatch, socketio, rounds=1):
+    """
+    Patch socketio so background tasks are captured instead of started.
+
+    Calling a captured task runs `rounds` iterations of its loop, then the
+    next sleep raises _StopTask.
+
+    Returns:
+        Tuple of (started task targets, sleep durations, (event, data, to) emits)
+    """
+    tasks, sleeps, emitted = [], [], []
+
+    def sleep(seconds):
+        if len(sleeps) == rounds:
+            raise _StopTask()
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(socketio, 'start_background_task',
+                        lambda target, *args, **kwargs: tasks.append(target))
+    monkeypatch.setattr(socketio, 'sleep', sleep)
+    monkeypatch.setattr(socketio, 'emit',
+                        lambda event, data, to=None, **kwargs: emitted.append((event, data, to)))
+    return tasks, sleeps, emitted
+
+
+@pytest.mark.unit
+def test_create_app_starts_one_telemetry_flusher(monkeypatch):
+    """Test that the coalescing flusher starts once and broadcasts pending telemetry."""
+    from app import create_app, socketio
+    from app import main as main_module
+
+    monkeypatch.setattr(main_module, '_flusher_started', False)
+    tasks, sleeps, emitted = _capture_background_tasks(monkeypatch, socketio)
+    config = {
+        'TESTING': True,
+        'SOCKETIO_ASYNC_MODE': 'threading',
+        'TELEMETRY_BROADCAST_INTERVAL': 0.05,
+    }
+    create_app(config)
+    create_app(config)
+    assert len(tasks) == 1
+
+    manager = main_module.session_manager
+    session_id = manager.create_session()
+    manager.add_dashboard(session_id, 'dashboard-sid')
+    manager.update_telemetry(session_id, {'lap': 7})
+    manager.mark_telemetry_pending(session_id)
+
+    with pytest.raises(_StopTask):
+        tasks[0]()
+
+    assert sleeps == [0.05]
+    assert emitted == [
+        ('telemetry_update', manager.get_session(session_id).telemetry_payload, 'dashboard-sid')
+    ]
+
+
+@pytest.mark.unit
+def test_create_app_starts_one_session_sweeper(monkeypatch):
+    """Test that the idle-session sweeper starts once and deletes unwatched idle sessions."""
+    import app.session_manager as sm_module
+    from app import create_app, socketio
+    from app import main as main_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(sm_module.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(main_module, '_sweeper_started', False)
+    tasks, sleeps, _ = _capture_background_tasks(monkeypatch, socketio)
+    config = {
+        'TESTING': True,
+        'SOCKETIO_ASYNC_MODE': 'threading',
+        'SESSION_IDLE_TIMEOUT': 900,
+        'SESSION_SWEEP_INTERVAL': 60,
+    }
+    create_app(config)
+    create_app(config)
+    assert len(tasks) == 1
+
+    manager = main_module.session_manager
+    idle = manager.create_session()
+    watched = manager.create_session()
+    manager.add_dashboard(watched, 'dashboard-sid')
+    clock[0] += 1000
+
+    with pytest.raises(_StopTask):
+        tasks[0]()
+
+    assert sleeps == [60]
+    assert manager.get_session(idle) is None
+    assert manager.get_active_sessions() == [watched]
+
+
 @pytest.mark.unit
 def test_home_route(client):
     """Test that GET / returns 200 and shows server status."""
@@ -134,6 +292,20 @@ def test_home_route(client):
     assert '1Lap' in data or 'Dashboard' in data or 'Server' in data
 
 
+@pytest.mark.unit
+def test_home_route_cacheable(client):
+    """Test that GET / sends caching headers and honours If-None-Match."""
+    response = client.get('/')
+
+    assert 'public' in response.headers['Cache-Control']
+    etag = response.headers.get('ETag')
+    assert etag
+
+    # Revalidation with the same ETag should not resend the body
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+
 @pytest.mark.unit
 def test_dashboard_route(client):
     """Test that GET /dashboard/<session_id> returns 200."""
@@ -160,6 +332,78 @@ def test_dashboard_session_id_passed_to_template(client):
     assert test_session_id in data
 
 
+@pytest.mark.unit
+def test_dashboard_cached_render_matches_template(app):
+    """Test that the cached dashboard HTML matches a full render, escaping included."""
+    from flask import render_template
+
+    session_id = 'a1b2c3d4-e5f6-7890-abcd-ef1234567890"<x>'
+    client = app.test_client()
+
+    first = client.get(f'/dashboard/{session_id}').data.decode('utf-8')
+    second = client.get('/dashboard/other-session').data.decode('utf-8')
+
+    with app.test_request_context():
+        expected = render_template('dashboard.html', session_id=session_id)
+    assert first == expected
+    assert '&lt;x&gt;' in first and '<x>' not in first
+    assert 'other-session' in second and session_id not in second
+
+
+@pytest.mark.unit
+def test_dashboard_concurrent_first_requests(app, monkeypatch):
+    """Test that two simultaneous first requests don't duplicate the cached page."""
+    import threading
+    from app import main as main_module
+
+    render = main_module.render_template
+    # Hold both requests inside the first render so each sees an empty cache
+    barrier = threading.Barrier(2, timeout=5)
+
+    def render_together(*args, **kwargs):
+        barrier.wait()
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(main_module, 'render_template', render_together)
+    bodies = []
+
+    def fetch():
+        bodies.append(app.test_client().get('/dashboard/abc').data)
+
+    threads = [threading.Thread(target=fetch) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    monkeypatch.setattr(main_module, 'render_template', render)
+    with app.test_request_context():
+        expected = render('dashboard.html', session_id='abc').encode('utf-8')
+    assert bodies == [expected, expected]
+    assert app.test_client().get('/dashboard/abc').data == expected
+
+
+@pytest.mark.unit
+def test_dashboard_rendered_per_request_with_auto_reload(app, monkeypatch):
+    """Test that TEMPLATES_AUTO_RELOAD bypasses the cached dashboard page."""
+    from app import main as main_module
+
+    render = main_module.render_template
+    rendered = []
+
+    def counting_render(*args, **kwargs):
+        rendered.append(kwargs.get('session_id'))
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(main_module, 'render_template', counting_render)
+    monkeypatch.setitem(app.config, 'TEMPLATES_AUTO_RELOAD', True)
+    client = app.test_client()
+    client.get('/dashboard/first')
+    client.get('/dashboard/second')
+
+    assert rendered == ['first', 'second']
+
+
 @pytest.mark.unit
 def test_static_files_accessible(client):
     """Test that static files can be served."""
@@ -1,5 +1,7 @@
 import pytest
 
+from tests.conftest import join_silent
+
 
 def _setup_session_and_clients(app):
     from app import socketio
@@ -8,8 +10,7 @@ def _setup_session_and_clients(app):
     session_id = monitor.get_received()[0]['args'][0]['session_id']
 
     dashboard = socketio.test_client(app)
-    dashboard.emit('join_session', {'session_id': session_id})
-    dashboard.get_received()  # clear any initial messages
+    join_silent(dashboard, session_id)
     return monitor, dashboard, session_id
 
 
@@ -48,3 +49,56 @@ def test_invalid_telemetry_rejected(app):
     received = dashboard.get_received()
     assert all(msg['name'] != 'telemetry_update' for msg in received)
 
+
+@pytest.mark.parametrize('use_fastjsonschema', [True, False])
+def test_compiled_validator_accepts_and_rejects(monkeypatch, use_fastjsonschema):
+    import app.main as main_module
+    from app.main import _compile_validator, SCHEMA_ERRORS
+    available = (main_module.FASTJSONSCHEMA_AVAILABLE if use_fastjsonschema
+                 else main_module.JSONSCHEMA_AVAILABLE)
+    if not available:
+        pytest.skip("Schema validation library not installed")
+    monkeypatch.setattr(main_module, 'FASTJSONSCHEMA_AVAILABLE', use_fastjsonschema)
+
+    schema = {
+        'type': 'object',
+        'required': ['session_id'],
+        'properties': {'session_id': {'type': 'string', 'format': 'uuid'}}
+    }
+    validate = _compile_validator(schema)
+
+    validate({'session_id': 'a1b2c3d4-e5f6-7890-abcd-ef1234567890'})
+    with pytest.raises(SCHEMA_ERRORS):
+        validate({'session_id': 42})
+    with pytest.raises(SCHEMA_ERRORS):
+        validate({})
+
+
+def test_schema_files_compiled_without_generated_module(monkeypatch):
+    import sys
+    import app.main as main_module
+    if not main_module.SCHEMA_ERRORS:
+        pytest.skip("No schema validation library installed")
+
+    # Force the fallback path that parses and compiles bugs/schemas/ at startup
+    monkeypatch.setitem(sys.modules, 'app._generated_validators', None)
+    monkeypatch.setattr(main_module, 'VALIDATION_REQUESTED', True)
+    monkeypatch.setattr(main_module, 'VALIDATION_ENABLED', False)
+    monkeypatch.setattr(main_module, 'SCHEMA_VALIDATORS', {})
+
+    main_module._load_schema_validators()
+
+    assert main_module.VALIDATION_ENABLED
+    with pytest.raises(main_module.SCHEMA_ERRORS):
+        main_module.SCHEMA_VALIDATORS['setup_data']({'setup': {}})
+
+
+def test_generated_validators_up_to_date():
+    fastjsonschema = pytest.importorskip('fastjsonschema')
+    from app import _generated_validators
+    if _generated_validators.VERSION != fastjsonschema.VERSION:
+        pytest.skip("Generated with a different fastjsonschema version")
+
+    from tools.compile_schemas import OUTPUT_PATH, generate
+    assert OUTPUT_PATH.read_text(encoding='utf-8') == generate(), \
+        "Schemas changed: run `python tools/compile_schemas.py`"
@@ -2,18 +2,27 @@
 Unit tests for SessionManager class.
 
 Tests session creation, data storage, and retrieval.
+
+Every test is independent, so the module can be split across workers:
+    pytest -n auto --dist loadfile tests/test_session_manager.py
 """
 
 import pytest
+import re
 import uuid
-from datetime import datetime
 from app.session_manager import SessionManager
 
+# Characters a canonical UUID string may contain
+_URL_SAFE_CHARS = frozenset('0123456789abcdef-')
+
+# UTC ISO 8601 timestamp as stored in Session.last_update
+_ISO_UTC_RE = re.compile(r'\A\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?\+00:00\Z')
 
-@pytest.fixture
-def session_manager():
-    """Create a fresh SessionManager instance for each test."""
-    return SessionManager()
+# Shareable dashboard URL: protocol, host, port, canonical session UUID
+_URL_RE = re.compile(
+    r'\A(https?)://([^:/\s]+):(\d+)/dashboard/'
+    r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\Z'
+)
 
 
 @pytest.mark.unit
@@ -35,10 +44,11 @@ def test_create_session(session_manager):
 @pytest.mark.unit
 def test_create_multiple_sessions(session_manager):
     """Test that multiple sessions have unique IDs."""
-    session_ids = [session_manager.create_session() for _ in range(10)]
+    create = session_manager.create_session
+    session_ids = {create() for _ in range(10)}
 
     # All IDs should be unique
-    assert len(session_ids) == len(set(session_ids))
+    assert len(session_ids) == 10
 
     # All sessions should be active
     active = session_manager.get_active_sessions()
@@ -46,19 +56,17 @@ def test_create_multiple_sessions(session_manager):
 
 
 @pytest.mark.unit
-def test_update_setup(session_manager, sample_setup_data):
+def test_update_setup(session_manager, sample_setup_data, iso_now):
     """Test storing setup data for a session."""
     session_id = session_manager.create_session()
-    timestamp = datetime.utcnow().isoformat()
 
     # Update setup data
-    session_manager.update_setup(session_id, sample_setup_data, timestamp)
+    session_manager.update_setup(session_id, sample_setup_data, iso_now)
 
     # Retrieve and verify
     session = session_manager.get_session(session_id)
     assert session is not None
-    assert session['setup'] == sample_setup_data
-    assert session['setup_timestamp'] == timestamp
+    assert (session.setup, session.setup_timestamp) == (sample_setup_data, iso_now)
 
 
 @pytest.mark.unit
@@ -72,33 +80,89 @@ def test_update_telemetry(session_manager, sample_telemetry_data):
     # Retrieve and verify
     session = session_manager.get_session(session_id)
     assert session is not None
-    assert session['telemetry'] == sample_telemetry_data
-    assert 'last_update' in session
+    assert session.telemetry == sample_telemetry_data
+    assert session.last_update is not None
+
+    # Verify timestamp format (ISO 8601, UTC)
+    assert _ISO_UTC_RE.match(session.last_update)
+
+
+@pytest.mark.unit
+def test_update_with_session_skips_lookup(session_manager, sample_setup_data,
+                                          sample_telemetry_data, iso_now, monkeypatch):
+    """Test that passing the already-fetched Session updates it without a store lookup."""
+    session_id = session_manager.create_session()
+    session = session_manager.get_session(session_id)
+
+    class NoLookups(dict):
+        def get(self, *args):
+            raise AssertionError("session store looked up again")
+
+    monkeypatch.setattr(session_manager, '_sessions', NoLookups(session_manager._sessions))
+    session_manager.update_setup(session_id, sample_setup_data, iso_now, session=session)
+    session_manager.update_telemetry(session_id, sample_telemetry_data, session=session)
+
+    assert (session.setup, session.setup_timestamp, session.telemetry) == \
+        (sample_setup_data, iso_now, sample_telemetry_data)
+    assert session.telemetry_payload == {'session_id': session_id, 'telemetry': sample_telemetry_data}
+
+
+@pytest.mark.unit
+def test_last_update_timestamp_reused_within_second(session_manager, sample_telemetry_data,
+                                                   monkeypatch):
+    """Test that telemetry timestamps are UTC, second resolution, and cached."""
+    import app.session_manager as sm_module
+    first = session_manager.create_session()
+    second = session_manager.create_session()
+
+    monkeypatch.setattr(sm_module.time, 'time', lambda: 1763821800.25)
+    session_manager.update_telemetry(first, sample_telemetry_data)
+    monkeypatch.setattr(sm_module.time, 'time', lambda: 1763821800.75)
+    session_manager.update_telemetry(second, sample_telemetry_data)
 
-    # Verify timestamp format (ISO 8601)
-    datetime.fromisoformat(session['last_update'])  # Should not raise
+    stamp = session_manager.get_session(first).last_update
+    assert stamp == '2025-11-22T14:30:00+00:00'
+
+    # Updates within the same second share the formatted string
+    assert session_manager.get_session(second).last_update is stamp
 
 
 @pytest.mark.unit
-def test_get_session(session_manager, sample_setup_data, sample_telemetry_data):
+def test_get_session(session_manager, sample_setup_data, sample_telemetry_data, iso_now):
     """Test retrieving complete session data."""
     session_id = session_manager.create_session()
-    timestamp = datetime.utcnow().isoformat()
 
     # Add both setup and telemetry
-    session_manager.update_setup(session_id, sample_setup_data, timestamp)
+    session_manager.update_setup(session_id, sample_setup_data, iso_now)
     session_manager.update_telemetry(session_id, sample_telemetry_data)
 
     # Retrieve session
     session = session_manager.get_session(session_id)
 
     # Verify structure
-    assert session['session_id'] == session_id
-    assert 'created_at' in session
-    assert session['setup'] == sample_setup_data
-    assert session['setup_timestamp'] == timestamp
-    assert session['telemetry'] == sample_telemetry_data
-    assert 'last_update' in session
+    assert (session.session_id, session.setup, session.setup_timestamp, session.telemetry) == \
+        (session_id, sample_setup_data, iso_now, sample_telemetry_data)
+    assert None not in (session.created_at, session.last_update)
+
+
+@pytest.mark.unit
+def test_update_builds_event_payloads(session_manager, sample_setup_data, sample_telemetry_data, iso_now):
+    """Test that updates pre-build the broadcast envelopes."""
+    session_id = session_manager.create_session()
+
+    session_manager.update_setup(session_id, sample_setup_data, iso_now)
+    session_manager.update_telemetry(session_id, sample_telemetry_data)
+
+    session = session_manager.get_session(session_id)
+    assert session.setup_payload == {
+        'session_id': session_id,
+        'timestamp': iso_now,
+        'setup': sample_setup_data
+    }
+    assert session.telemetry_payload == {
+        'session_id': session_id,
+        'telemetry': sample_telemetry_data
+    }
 
 
 @pytest.mark.unit
@@ -133,16 +197,144 @@ def test_get_active_sessions(session_manager):
     # Create multiple sessions
     ids = [session_manager.create_session() for _ in range(5)]
 
+    ids_set = set(ids)
+
     # Should return all session IDs
     active = session_manager.get_active_sessions()
     assert len(active) == 5
-    assert set(active) == set(ids)
+    assert set(active) == ids_set
 
     # Delete one session
     session_manager.delete_session(ids[0])
     active = session_manager.get_active_sessions()
     assert len(active) == 4
-    assert ids[0] not in active
+    assert set(active) == ids_set - {ids[0]}
+
+
+@pytest.mark.unit
+def test_session_ids_interned(session_manager):
+    """Test that stored session IDs are interned strings."""
+    import sys
+    session_id = session_manager.create_session()
+
+    assert sys.intern(''.join(session_id)) is session_id
+    assert next(iter(session_manager._sessions)) is session_id
+
+
+@pytest.mark.unit
+def test_add_and_remove_dashboard(session_manager):
+    """Test subscribing dashboard SIDs to sessions and removing them."""
+    session_a = session_manager.create_session()
+    session_b = session_manager.create_session()
+
+    session_manager.add_dashboard(session_a, 'sid-1')
+    session_manager.add_dashboard(session_b, 'sid-1')
+    session_manager.add_dashboard(session_a, 'sid-2')
+
+    assert session_manager.get_session(session_a).dashboard_sids == {'sid-1', 'sid-2'}
+    assert session_manager.get_session(session_b).dashboard_sids == {'sid-1'}
+
+    # Disconnecting sid-1 removes it from every session it joined
+    session_manager.remove_dashboard('sid-1')
+    assert session_manager.get_session(session_a).dashboard_sids == {'sid-2'}
+    assert session_manager.get_session(session_b).dashboard_sids == set()
+
+    # Unknown SIDs are ignored
+    session_manager.remove_dashboard('never-joined')
+
+
+@pytest.mark.unit
+def test_add_dashboard_nonexistent_session(session_manager):
+    """Test that subscribing to a missing session raises KeyError."""
+    with pytest.raises(KeyError):
+        session_manager.add_dashboard('nonexistent-uuid', 'sid-1')
+
+
+@pytest.mark.unit
+def test_delete_session_drops_dashboard_index(session_manager):
+    """Test that deleting a session clears its dashboard reverse index."""
+    session_id = session_manager.create_session()
+    session_manager.add_dashboard(session_id, 'sid-1')
+
+    session_manager.delete_session(session_id)
+
+    assert session_manager._dashboard_sessions == {}
+
+
+@pytest.mark.unit
+def test_evict_idle_sessions(session_manager, monkeypatch):
+    """Test that only unwatched sessions idle past the timeout are deleted."""
+    import app.session_manager as sm_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(sm_module.time, 'monotonic', lambda: clock[0])
+    idle = session_manager.create_session()
+    watched = session_manager.create_session()
+    active = session_manager.create_session()
+    session_manager.add_dashboard(watched, 'sid-1')
+
+    clock[0] += 600
+    session_manager.update_telemetry(active, {'lap': 1})
+    clock[0] += 600
+
+    assert session_manager.evict_idle_sessions(900) == [idle]
+    assert sorted(session_manager.get_active_sessions()) == sorted([watched, active])
+    assert session_manager.evict_idle_sessions(900) == []
+
+    # Evictable once its last dashboard disconnects
+    session_manager.remove_dashboard('sid-1')
+    assert session_manager.evict_idle_sessions(900) == [watched]
+    assert session_manager._dashboard_sessions == {}
+
+
+@pytest.mark.unit
+def test_evict_idle_sessions_tolerates_concurrent_create(session_manager):
+    """Test that sessions created during a sweep don't break the iteration."""
+    created = []
+
+    class CreatesSessionWhenChecked:
+        """Stands in for a session; creates another one when the sweep reads it."""
+        dashboard_sids = ()
+
+        @property
+        def last_activity(self):
+            created.append(session_manager.create_session())
+            return float('inf')
+
+    session_manager._sessions['in-flight'] = CreatesSessionWhenChecked()
+
+    assert session_manager.evict_idle_sessions(900) == []
+    assert created[0] in session_manager.get_active_sessions()
+
+
+@pytest.mark.unit
+def test_clear(session_manager):
+    """Test that clear() drops sessions, subscriptions and pending telemetry."""
+    session_id = session_manager.create_session()
+    session_manager.add_dashboard(session_id, 'sid-1')
+    session_manager.mark_telemetry_pending(session_id)
+
+    session_manager.clear()
+
+    assert session_manager.get_active_sessions() == []
+    assert session_manager._dashboard_sessions == {}
+    assert session_manager.drain_pending_telemetry() == []
+
+
+@pytest.mark.unit
+def test_drain_pending_telemetry(session_manager):
+    """Test that pending telemetry is drained once and skips deleted sessions."""
+    kept = session_manager.create_session()
+    deleted = session_manager.create_session()
+    session_manager.mark_telemetry_pending(kept)
+    session_manager.mark_telemetry_pending(kept)
+    session_manager.mark_telemetry_pending(deleted)
+    session_manager.delete_session(deleted)
+
+    drained = session_manager.drain_pending_telemetry()
+
+    assert [session.session_id for session in drained] == [kept]
+    assert session_manager.drain_pending_telemetry() == []
 
 
 # ============================================================================
@@ -154,28 +346,36 @@ def test_session_id_is_valid_uuid4(session_manager):
     """Test that session IDs are valid UUID4 format."""
     session_id = session_manager.create_session()
 
-    # Should be parseable as UUID
-    parsed_uuid = uuid.UUID(session_id)
-
-    # Should be UUID version 4 (random)
-    assert parsed_uuid.version == 4
+    # Version nibble is 4 (random), variant nibble is RFC 4122 (10xx)
+    assert len(session_id) == 36
+    assert session_id[14] == '4'
+    assert session_id[19] in '89ab'
 
-    # Should match original string
-    assert str(parsed_uuid) == session_id
+    # Should parse as a UUID and already be in canonical form
+    assert str(uuid.UUID(session_id)) == session_id
 
 
 @pytest.mark.unit
 def test_session_id_uniqueness_large_sample(session_manager):
     """Test that session IDs are unique across large sample (collision test)."""
-    # Generate 1000 session IDs
-    session_ids = [session_manager.create_session() for _ in range(1000)]
+    # Generate 1000 session IDs straight into a set; all should be unique
+    create = session_manager.create_session
+    session_ids = {create() for _ in range(1000)}
+    assert len(session_ids) == 1000
+
+    # All should be valid UUID4s
+    assert all(uuid.UUID(session_id).version == 4 for session_id in session_ids)
 
-    # All should be unique
-    assert len(session_ids) == len(set(session_ids))
 
-    # All should be valid UUIDs
-    for session_id in session_ids:
-        uuid.UUID(session_id)  # Should not raise
+@pytest.mark.unit
+def test_session_ids_across_pool_refill(session_manager):
+    """Test that IDs stay unique UUID4s when the entropy pool is refilled."""
+    from app.session_manager import _UUID_BATCH
+
+    session_ids = [session_manager.create_session() for _ in range(_UUID_BATCH + 1)]
+
+    assert len(set(session_ids)) == len(session_ids)
+    assert all(uuid.UUID(sid).version == 4 for sid in session_ids)
 
 
 @pytest.mark.unit
@@ -185,95 +385,66 @@ def test_session_id_url_safe(session_manager):
 
     # UUID4 format: 8-4-4-4-12 hexadecimal digits with hyphens
     # Should only contain: 0-9, a-f, and hyphens
-    allowed_chars = set('0123456789abcdef-')
-    assert set(session_id).issubset(allowed_chars)
-
-    # Should not need URL encoding
-    import urllib.parse
-    assert urllib.parse.quote(session_id, safe='') == session_id.replace('-', '%2D') or \
-           urllib.parse.quote(session_id, safe='-') == session_id
+    # Should not need URL encoding: all of these are RFC 3986 unreserved
+    assert _URL_SAFE_CHARS.issuperset(session_id)
 
 
 @pytest.mark.unit
-def test_construct_dashboard_url(session_manager):
+@pytest.mark.parametrize("host, port, expected_prefix", [
+    ('localhost', 5000, 'http://localhost:5000/dashboard/'),
+    ('192.168.1.100', 5000, 'http://192.168.1.100:5000/dashboard/'),
+    ('example.com', 8080, 'http://example.com:8080/dashboard/'),
+])
+def test_construct_dashboard_url(session_manager, host, port, expected_prefix):
     """Test constructing dashboard URL from session ID."""
     session_id = session_manager.create_session()
 
-    # Test different server configurations
-    test_cases = [
-        ('localhost', 5000, f'http://localhost:5000/dashboard/{session_id}'),
-        ('192.168.1.100', 5000, f'http://192.168.1.100:5000/dashboard/{session_id}'),
-        ('example.com', 8080, f'http://example.com:8080/dashboard/{session_id}'),
-    ]
-
-    for host, port, expected_url in test_cases:
-        url = f'http://{host}:{port}/dashboard/{session_id}'
-        assert url == expected_url
-        assert session_id in url
-        assert '/dashboard/' in url
-
-
-@pytest.mark.unit
-def test_validate_session_id_format():
-    """Test validation of session ID format using uuid.UUID()."""
-    # Valid UUIDs
-    valid_ids = [
-        'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
-        '550e8400-e29b-41d4-a716-446655440000',
-        '12345678-1234-4234-8234-123456789012',
-    ]
-
-    for session_id in valid_ids:
-        try:
-            uuid.UUID(session_id)
-            is_valid = True
-        except ValueError:
-            is_valid = False
-        assert is_valid, f"Expected {session_id} to be valid"
-
-    # Invalid UUIDs
-    invalid_ids = [
-        'not-a-uuid',
-        '12345',
-        'abcd-efgh-ijkl-mnop',
-        'a1b2c3d4-e5f6-7890-abcd',  # Too short
-        'a1b2c3d4-e5f6-7890-abcd-ef1234567890-extra',  # Too long
-        '',
-    ]
-
-    for session_id in invalid_ids:
-        try:
-            uuid.UUID(session_id)
-            is_valid = False  # Should have raised
-        except (ValueError, AttributeError, TypeError):
-            is_valid = True  # Correctly rejected
-        assert is_valid, f"Expected {session_id} to be invalid"
-
-    # Test None separately (raises TypeError)
-    try:
-        uuid.UUID(None)
-        is_valid_none = False
-    except (TypeError, AttributeError):
-        is_valid_none = True
-    assert is_valid_none, "Expected None to be invalid"
-
-
-@pytest.mark.unit
-def test_session_id_persistence_simulation(session_manager):
+    url = SessionManager.construct_dashboard_url(session_id, host=host, port=port)
+    assert url == expected_prefix + session_id
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("session_id", [
+    'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+    '550e8400-e29b-41d4-a716-446655440000',
+    '12345678-1234-4234-8234-123456789012',
+])
+def test_validate_session_id_format_valid(session_id):
+    """Test that well-formed session IDs parse with uuid.UUID()."""
+    uuid.UUID(session_id)  # Should not raise
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("session_id", [
+    'not-a-uuid',
+    '12345',
+    'abcd-efgh-ijkl-mnop',
+    'a1b2c3d4-e5f6-7890-abcd',  # Too short
+    'a1b2c3d4-e5f6-7890-abcd-ef1234567890-extra',  # Too long
+    '',
+    None,
+])
+def test_validate_session_id_format_invalid(session_id):
+    """Test that malformed session IDs are rejected by uuid.UUID()."""
+    with pytest.raises((ValueError, AttributeError, TypeError)):
+        uuid.UUID(session_id)
+
+
+@pytest.mark.unit
+def test_session_id_persistence_simulation(session_manager, iso_now):
     """Test that session ID remains constant (simulating URL persistence)."""
     # Create session (monitor connects)
     session_id = session_manager.create_session()
-    original_url = f'http://localhost:5000/dashboard/{session_id}'
+    original_url = SessionManager.construct_dashboard_url(session_id)
 
     # Add setup data (monitor sends setup)
     setup = {'test': 'data'}
-    timestamp = datetime.utcnow().isoformat()
-    session_manager.update_setup(session_id, setup, timestamp)
+    session_manager.update_setup(session_id, setup, iso_now)
 
     # Session ID should not change
     session = session_manager.get_session(session_id)
-    assert session['session_id'] == session_id
-    url_after_setup = f'http://localhost:5000/dashboard/{session["session_id"]}'
+    assert session.session_id == session_id
+    url_after_setup = SessionManager.construct_dashboard_url(session.session_id)
     assert url_after_setup == original_url
 
     # Add telemetry data (monitor sends telemetry)
@@ -282,32 +453,22 @@ def test_session_id_persistence_simulation(session_manager):
 
     # Session ID should still not change
     session = session_manager.get_session(session_id)
-    assert session['session_id'] == session_id
-    url_after_telemetry = f'http://localhost:5000/dashboard/{session["session_id"]}'
+    assert session.session_id == session_id
+    url_after_telemetry = SessionManager.construct_dashboard_url(session.session_id)
     assert url_after_telemetry == original_url
 
 
 @pytest.mark.unit
-def test_url_format_requirements():
+def test_url_format_requirements(sample_session_id):
     """Test that URL format meets all specification requirements."""
-    session_id = str(uuid.uuid4())
-    host = '192.168.1.100'
-    port = 5000
+    session_id = sample_session_id
+    url = SessionManager.construct_dashboard_url(session_id, host='192.168.1.100', port=5000)
 
-    # Construct URL
-    url = f'http://{host}:{port}/dashboard/{session_id}'
-
-    # Test requirements from specification
-    assert url.startswith('http://'), "URL should start with http://"
-    assert '/dashboard/' in url, "URL should contain /dashboard/ path"
-    assert session_id in url, "URL should contain session ID"
-    assert len(session_id) == 36, "Session ID should be 36 characters"
-    assert session_id.count('-') == 4, "Session ID should have 4 hyphens"
-
-    # Test URL is shareable (no complex encoding needed)
-    assert ' ' not in url, "URL should not contain spaces"
-    assert '\n' not in url, "URL should not contain newlines"
-    assert '\t' not in url, "URL should not contain tabs"
+    # http://<host>:<port>/dashboard/<8-4-4-4-12 hex UUID>, with no
+    # whitespace anywhere (shareable without encoding)
+    match = _URL_RE.match(url)
+    assert match, f"URL does not match the specified format: {url!r}"
+    assert match.groups() == ('http', '192.168.1.100', '5000', session_id)
 
 
 # ============================================================================
@@ -315,53 +476,67 @@ def test_url_format_requirements():
 # ============================================================================
 
 @pytest.mark.unit
-def test_validate_session_id_valid():
+@pytest.mark.parametrize("session_id", [
+    str(uuid.uuid4()),
+    'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+    '550e8400-e29b-41d4-a716-446655440000',
+])
+def test_validate_session_id_valid(session_id):
     """Test session ID validation with valid UUIDs."""
-    valid_uuids = [
-        str(uuid.uuid4()),
-        'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
-        '550e8400-e29b-41d4-a716-446655440000',
-    ]
-
-    for session_id in valid_uuids:
-        is_valid, error = SessionManager.validate_session_id(session_id)
-        assert is_valid is True, f"Expected {session_id} to be valid"
-        assert error is None, f"Expected no error for {session_id}"
+    is_valid, error = SessionManager.validate_session_id(session_id)
+    assert is_valid is True, f"Expected {session_id} to be valid"
+    assert error is None, f"Expected no error for {session_id}"
 
 
 @pytest.mark.unit
-def test_validate_session_id_invalid():
+@pytest.mark.parametrize("session_id, expected_error_fragment", [
+    ('', "Session ID cannot be empty"),
+    ('not-a-uuid', "Invalid UUID format"),
+    ('12345', "Invalid UUID format"),
+    ('a1b2c3d4-e5f6-7890-abcd', "Invalid UUID format"),  # Too short
+    ('A1B2C3D4-E5F6-7890-ABCD-EF1234567890', "Invalid UUID format"),  # Not normalized
+    ('{a1b2c3d4-e5f6-7890-abcd-ef1234567890}', "Invalid UUID format"),
+    ('a1b2c3d4-e5f6-7890-abcd-ef1234567890\n', "Invalid UUID format"),
+    ('a' * 4096, "Invalid UUID format"),  # Oversized client input
+], ids=['empty', 'not-a-uuid', 'digits', 'too-short', 'uppercase', 'braces',
+        'trailing-newline', 'oversized'])
+def test_validate_session_id_invalid(session_id, expected_error_fragment):
     """Test session ID validation with invalid inputs."""
-    invalid_cases = [
-        ('', "Session ID cannot be empty"),
-        ('not-a-uuid', "Invalid UUID format"),
-        ('12345', "Invalid UUID format"),
-        ('a1b2c3d4-e5f6-7890-abcd', "Invalid UUID format"),  # Too short
-    ]
-
-    for session_id, expected_error_fragment in invalid_cases:
-        is_valid, error = SessionManager.validate_session_id(session_id)
-        assert is_valid is False, f"Expected {session_id} to be invalid"
-        assert error is not None, f"Expected error message for {session_id}"
-        assert expected_error_fragment.lower() in error.lower(), \
-            f"Expected error to contain '{expected_error_fragment}' but got '{error}'"
+    is_valid, error = SessionManager.validate_session_id(session_id)
+    assert is_valid is False, f"Expected {session_id} to be invalid"
+    assert error is not None, f"Expected error message for {session_id}"
+    assert expected_error_fragment.lower() in error.lower(), \
+        f"Expected error to contain '{expected_error_fragment}' but got '{error}'"
 
 
 @pytest.mark.unit
-def test_validate_session_id_type_errors():
+@pytest.mark.parametrize("invalid_input", [None, 123, [], {}])
+def test_validate_session_id_type_errors(invalid_input):
     """Test session ID validation with wrong types."""
-    invalid_types = [None, 123, [], {}]
+    is_valid, error = SessionManager.validate_session_id(invalid_input)
+    assert is_valid is False, f"Expected {invalid_input} to be invalid"
+    assert error is not None
+
 
-    for invalid_input in invalid_types:
-        is_valid, error = SessionManager.validate_session_id(invalid_input)
-        assert is_valid is False, f"Expected {invalid_input} to be invalid"
-        assert error is not None
+@pytest.mark.unit
+def test_validate_session_id_caches_uuid_sized_input():
+    """Test that repeat IDs hit the cache and oversized input never enters it."""
+    from app.session_manager import _match_session_id
+    _match_session_id.cache_clear()
+
+    SessionManager.validate_session_id('a' * 4096)
+    assert _match_session_id.cache_info().currsize == 0
+
+    session_id = str(uuid.uuid4())
+    assert SessionManager.validate_session_id(session_id) == (True, None)
+    assert SessionManager.validate_session_id(session_id) == (True, None)
+    assert _match_session_id.cache_info().hits == 1
 
 
 @pytest.mark.unit
-def test_construct_dashboard_url_defaults():
+def test_construct_dashboard_url_defaults(sample_session_id):
     """Test dashboard URL construction with default parameters."""
-    session_id = str(uuid.uuid4())
+    session_id = sample_session_id
     url = SessionManager.construct_dashboard_url(session_id)
 
     # Should use defaults: localhost, port 5000, http
@@ -369,9 +544,9 @@ def test_construct_dashboard_url_defaults():
 
 
 @pytest.mark.unit
-def test_construct_dashboard_url_custom_params():
+def test_construct_dashboard_url_custom_params(sample_session_id):
     """Test dashboard URL construction with custom parameters."""
-    session_id = str(uuid.uuid4())
+    session_id = sample_session_id
 
     # Test custom host and port
     url = SessionManager.construct_dashboard_url(
@@ -405,11 +580,11 @@ def test_construct_dashboard_url_integration(session_manager):
     )
 
     # Verify structure
-    assert session_id in url
+    match = _URL_RE.match(url)
+    assert match and match.group(4) == session_id
     assert url.startswith('http://192.168.1.100:5000/dashboard/')
-    assert len(url) > 40  # Host + path + UUID should be substantial
 
     # Verify session exists
     session = session_manager.get_session(session_id)
     assert session is not None
-    assert session['session_id'] == session_id
+    assert session.session_id == session_id
@@ -20,12 +20,32 @@ Running WebSocket Tests:
 
     # With coverage
     pytest tests/test_websocket.py --cov=app --cov-report=term-missing
+
+    # In parallel (needs pytest-xdist; each worker builds its own app)
+    pytest tests/test_websocket.py -n auto --dist loadgroup
 """
 
 import pytest
+from app import socketio
+from app.main import flush_pending_telemetry, session_manager
+from tests.conftest import (
+    by_name,
+    count_msgs,
+    drain,
+    emit_many,
+    extract_sid,
+    first_msg
+)
 from tests.test_data import generate_telemetry, generate_setup
+import re
 import uuid
 
+# Well-formed session ID that the server never issued
+FAKE_SID = str(uuid.uuid4())
+
+# Canonical lowercase UUID4: version nibble 4, RFC 4122 variant
+_UUID4_RE = re.compile(r'\A[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z')
+
 
 @pytest.mark.unit
 class TestMonitorEvents:
@@ -38,7 +58,7 @@ class TestMonitorEvents:
         - telemetry_update: Monitor sends telemetry updates (2Hz)
     """
 
-    def test_request_session_id(self, app):
+    def test_request_session_id(self, sio_clients):
         """
         Test monitor requesting session ID.
 
@@ -53,33 +73,25 @@ class TestMonitorEvents:
             - Session ID is valid UUID
             - Session is created in SessionManager
         """
-        from app import socketio
 
         # Create monitor client
-        monitor = socketio.test_client(app)
+        monitor = sio_clients()
         assert monitor.is_connected()
 
         # Request session ID
         monitor.emit('request_session_id', {})
 
         # Get response
-        received = monitor.get_received()
+        received = drain(monitor)
         assert len(received) == 1
         assert received[0]['name'] == 'session_id_assigned'
 
         # Verify session ID format
         session_id = received[0]['args'][0]['session_id']
         assert isinstance(session_id, str)
-        assert len(session_id) == 36  # UUID4 format with hyphens
-
-        # Verify it's a valid UUID
-        try:
-            parsed_uuid = uuid.UUID(session_id)
-            assert str(parsed_uuid) == session_id
-        except ValueError:
-            pytest.fail(f"Invalid UUID format: {session_id}")
+        assert _UUID4_RE.match(session_id), f"Invalid UUID format: {session_id}"
 
-    def test_setup_data_storage(self, app, sample_setup_data):
+    def test_setup_data_storage(self, monitor_session, sample_setup_data):
         """
         Test monitor sending setup data.
 
@@ -94,14 +106,9 @@ class TestMonitorEvents:
             - Session data structure is correct
             - Timestamps are preserved
         """
-        from app import socketio
-        from app.main import session_manager
 
         # Create monitor and get session ID
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         # Send setup data
         timestamp = '2025-11-22T14:30:00.000Z'
@@ -114,10 +121,10 @@ class TestMonitorEvents:
         # Verify setup stored in SessionManager
         session = session_manager.get_session(session_id)
         assert session is not None
-        assert session['setup'] == sample_setup_data
-        assert session['setup_timestamp'] == timestamp
+        assert session.setup == sample_setup_data
+        assert session.setup_timestamp == timestamp
 
-    def test_telemetry_update_storage(self, app, sample_telemetry_data):
+    def test_telemetry_update_storage(self, monitor_session, sample_telemetry_data):
         """
         Test monitor sending telemetry updates.
 
@@ -132,14 +139,9 @@ class TestMonitorEvents:
             - Latest telemetry replaces previous
             - Timestamps are updated
         """
-        from app import socketio
-        from app.main import session_manager
 
         # Create monitor and get session ID
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         # Send telemetry update
         monitor.emit('telemetry_update', {
@@ -150,10 +152,10 @@ class TestMonitorEvents:
         # Verify telemetry stored in SessionManager
         session = session_manager.get_session(session_id)
         assert session is not None
-        assert session['telemetry'] == sample_telemetry_data
-        assert session['last_update'] is not None
+        assert session.telemetry == sample_telemetry_data
+        assert session.last_update is not None
 
-    def test_multiple_telemetry_updates(self, app):
+    def test_multiple_telemetry_updates(self, monitor_session):
         """
         Test multiple consecutive telemetry updates.
 
@@ -167,27 +169,21 @@ class TestMonitorEvents:
             - Latest telemetry is always stored
             - No data corruption
         """
-        from app import socketio
-        from app.main import session_manager
 
         # Setup
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         # Send 5 telemetry updates
-        for lap_num in range(1, 6):
-            telemetry = generate_telemetry(lap=lap_num, fuel=80.0 - (lap_num * 2.5))
-            monitor.emit('telemetry_update', {
-                'session_id': session_id,
-                'telemetry': telemetry
-            })
+        emit_many(monitor, 'telemetry_update', [
+            {'session_id': session_id,
+             'telemetry': generate_telemetry(lap=lap_num, fuel=80.0 - (lap_num * 2.5))}
+            for lap_num in range(1, 6)
+        ])
 
         # Verify last telemetry is stored
         session = session_manager.get_session(session_id)
-        assert session['telemetry']['lap'] == 5
-        assert session['telemetry']['fuel'] == 67.5  # 80 - (5 * 2.5)
+        assert session.telemetry['lap'] == 5
+        assert session.telemetry['fuel'] == 67.5  # 80 - (5 * 2.5)
 
 
 @pytest.mark.unit
@@ -199,7 +195,7 @@ class TestDashboardEvents:
         - join_session: Dashboard joins session room to receive broadcasts
     """
 
-    def test_join_session_without_data(self, app):
+    def test_join_session_without_data(self, monitor_session, sio_clients):
         """
         Test dashboard joining session with no prior data.
 
@@ -214,22 +210,18 @@ class TestDashboardEvents:
             - No errors when no data exists
             - Room joining works
         """
-        from app import socketio
 
         # Create session via monitor
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         # Dashboard joins session
-        dashboard = socketio.test_client(app)
+        dashboard = sio_clients()
         dashboard.emit('join_session', {'session_id': session_id})
 
         # Dashboard should be connected (no errors)
         assert dashboard.is_connected()
 
-    def test_join_session_with_existing_setup(self, app, sample_setup_data):
+    def test_join_session_with_existing_setup(self, monitor_session, sio_clients, sample_setup_data):
         """
         Test dashboard joining session with existing setup data.
 
@@ -243,13 +235,9 @@ class TestDashboardEvents:
             - Setup is cached and delivered correctly
             - Data structure matches expected format
         """
-        from app import socketio
 
         # Create session and send setup
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         timestamp = '2025-11-22T14:30:00.000Z'
         monitor.emit('setup_data', {
@@ -259,16 +247,15 @@ class TestDashboardEvents:
         })
 
         # Dashboard joins after setup sent
-        dashboard = socketio.test_client(app)
+        dashboard = sio_clients()
         dashboard.emit('join_session', {'session_id': session_id})
 
         # Dashboard should receive setup_update
-        received = dashboard.get_received()
-        setup_updates = [msg for msg in received if msg['name'] == 'setup_update']
-        assert len(setup_updates) == 1
-        assert setup_updates[0]['args'][0]['setup'] == sample_setup_data
+        received = drain(dashboard)
+        assert count_msgs(received, 'setup_update') == 1
+        assert by_name(received)['setup_update']['args'][0]['setup'] == sample_setup_data
 
-    def test_join_session_with_existing_telemetry(self, app, sample_telemetry_data):
+    def test_join_session_with_existing_telemetry(self, monitor_session, sio_clients, sample_telemetry_data):
         """
         Test dashboard joining session with existing telemetry.
 
@@ -281,13 +268,9 @@ class TestDashboardEvents:
             - Late-joining dashboards get current telemetry
             - Telemetry is cached correctly
         """
-        from app import socketio
 
         # Create session and send telemetry
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
         monitor.emit('telemetry_update', {
             'session_id': session_id,
@@ -295,14 +278,13 @@ class TestDashboardEvents:
         })
 
         # Dashboard joins after telemetry sent
-        dashboard = socketio.test_client(app)
+        dashboard = sio_clients()
         dashboard.emit('join_session', {'session_id': session_id})
 
         # Dashboard should receive telemetry_update
-        received = dashboard.get_received()
-        telemetry_updates = [msg for msg in received if msg['name'] == 'telemetry_update']
-        assert len(telemetry_updates) == 1
-        assert telemetry_updates[0]['args'][0]['telemetry'] == sample_telemetry_data
+        received = drain(dashboard)
+        assert count_msgs(received, 'telemetry_update') == 1
+        assert by_name(received)['telemetry_update']['args'][0]['telemetry'] == sample_telemetry_data
 
 
 @pytest.mark.unit
@@ -312,12 +294,11 @@ class TestBroadcasting:
 
     Broadcasting scenarios tested:
         - Setup broadcast to single dashboard
-        - Telemetry broadcast to single dashboard
-        - Broadcast to multiple dashboards
+        - Telemetry broadcast to one or several dashboards
         - Session isolation (no cross-contamination)
     """
 
-    def test_setup_broadcast_to_dashboard(self, app, sample_setup_data):
+    def test_setup_broadcast_to_dashboard(self, monitor_session, dashboard_factory, sample_setup_data):
         """
         Test setup broadcasting to connected dashboard.
 
@@ -328,21 +309,15 @@ class TestBroadcasting:
             4. Dashboard receives setup_update broadcast
 
         Verifies:
-            - Setup broadcasts to dashboards in room
+            - Setup reaches the session's lone dashboard (sent by SID)
             - Data matches what monitor sent
             - Broadcasting happens immediately
         """
-        from app import socketio
 
         # Setup monitor and dashboard
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
 
-        dashboard = socketio.test_client(app)
-        dashboard.emit('join_session', {'session_id': session_id})
-        dashboard.get_received()  # Clear any initial messages
+        dashboard = dashboard_factory(session_id)
 
         # Monitor sends setup
         timestamp = '2025-11-22T14:30:00.000Z'
@@ -353,38 +328,32 @@ class TestBroadcasting:
         })
 
         # Dashboard receives setup_update
-        received = dashboard.get_received()
-        assert len(received) >= 1
-        setup_msg = next((msg for msg in received if msg['name'] == 'setup_update'), None)
-        assert setup_msg is not None
-        assert setup_msg['args'][0]['setup'] == sample_setup_data
+        msgs = by_name(drain(dashboard))
+        assert 'setup_update' in msgs
+        assert msgs['setup_update']['args'][0]['setup'] == sample_setup_data
 
-    def test_telemetry_broadcast_to_dashboard(self, app, sample_telemetry_data):
+    @pytest.mark.parametrize("n_dashboards", [1, 3])
+    def test_telemetry_broadcast_to_dashboards(self, monitor_session, dashboard_factory,
+                                               sample_telemetry_data, n_dashboards):
         """
-        Test telemetry broadcasting to connected dashboard.
+        Test telemetry broadcasting to one or several dashboards in a session.
 
         Flow:
             1. Monitor creates session
-            2. Dashboard joins session
+            2. n_dashboards dashboards join session
             3. Monitor sends telemetry
-            4. Dashboard receives telemetry_update broadcast
+            4. Every dashboard receives the telemetry_update broadcast
 
         Verifies:
-            - Telemetry broadcasts at 2Hz rate
-            - Data matches what monitor sent
-            - All fields are preserved
+            - A lone dashboard is sent the update directly by SID
+            - Several dashboards receive it through the session room
+            - All clients receive identical data
+            - All fields are preserved, no data loss
         """
-        from app import socketio
-
-        # Setup monitor and dashboard
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
 
-        dashboard = socketio.test_client(app)
-        dashboard.emit('join_session', {'session_id': session_id})
-        dashboard.get_received()  # Clear any initial messages
+        # Setup monitor and dashboards
+        monitor, session_id = monitor_session
+        dashboards = [dashboard_factory(session_id) for _ in range(n_dashboards)]
 
         # Monitor sends telemetry
         monitor.emit('telemetry_update', {
@@ -392,59 +361,75 @@ class TestBroadcasting:
             'telemetry': sample_telemetry_data
         })
 
-        # Dashboard receives telemetry_update
-        received = dashboard.get_received()
-        assert len(received) >= 1
-        telem_msg = next((msg for msg in received if msg['name'] == 'telemetry_update'), None)
-        assert telem_msg is not None
-        assert telem_msg['args'][0]['telemetry']['lap'] == sample_telemetry_data['lap']
+        # Every dashboard receives the full telemetry
+        telem_msgs = [first_msg(drain(dashboard), 'telemetry_update') for dashboard in dashboards]
+        assert None not in telem_msgs
+        assert [msg['args'][0]['telemetry'] for msg in telem_msgs] == \
+            [sample_telemetry_data] * n_dashboards
 
-    def test_broadcast_to_multiple_dashboards(self, app, sample_telemetry_data):
+    @pytest.mark.parametrize("n_dashboards", [1, 3])
+    def test_telemetry_burst_coalesced(self, app, monitor_session, dashboard_factory,
+                                       sample_telemetry_data, monkeypatch, n_dashboards):
         """
-        Test broadcasting to multiple dashboards in same session.
+        Test telemetry bursts are collapsed into one broadcast when coalescing is on.
 
-        Flow:
-            1. Monitor creates session
-            2. Three dashboards join same session
-            3. Monitor sends telemetry
-            4. All three dashboards receive update
+        Verifies:
+            - Nothing is sent until the flusher runs
+            - One flush sends only the latest telemetry, by SID or via the room
+            - An empty flush sends nothing
+        """
+
+        monkeypatch.setitem(app.config, 'TELEMETRY_BROADCAST_INTERVAL', 0.05)
+
+        monitor, session_id = monitor_session
+        dashboards = [dashboard_factory(session_id) for _ in range(n_dashboards)]
+
+        for lap in range(1, 4):
+            monitor.emit('telemetry_update', {
+                'session_id': session_id,
+                'telemetry': dict(sample_telemetry_data, lap=lap)
+            })
+        assert [drain(dashboard) for dashboard in dashboards] == [[]] * n_dashboards
+
+        flush_pending_telemetry(socketio)
+        for dashboard in dashboards:
+            received = drain(dashboard)
+            assert [msg['name'] for msg in received] == ['telemetry_update']
+            assert received[0]['args'][0]['telemetry']['lap'] == 3
+
+        flush_pending_telemetry(socketio)
+        assert [drain(dashboard) for dashboard in dashboards] == [[]] * n_dashboards
+
+    def test_no_echo_to_sending_monitor(self, monitor_session, dashboard_factory,
+                                        sample_setup_data, sample_telemetry_data):
+        """
+        Test a monitor that also joined its session does not get its own updates back.
 
         Verifies:
-            - Broadcasting works with multiple clients
-            - All clients receive identical data
-            - No data loss
+            - Sender receives no setup_update/telemetry_update echo
+            - Other dashboards still receive both
         """
-        from app import socketio
 
-        # Setup monitor
-        monitor = socketio.test_client(app)
-        monitor.emit('request_session_id', {})
-        response = monitor.get_received()
-        session_id = response[0]['args'][0]['session_id']
+        monitor, session_id = monitor_session
+        monitor.emit('join_session', {'session_id': session_id})
 
-        # Create 3 dashboards
-        dashboards = []
-        for _ in range(3):
-            dashboard = socketio.test_client(app)
-            dashboard.emit('join_session', {'session_id': session_id})
-            dashboard.get_received()  # Clear initial messages
-            dashboards.append(dashboard)
+        dashboard = dashboard_factory(session_id)
 
-        # Monitor sends telemetry
+        monitor.emit('setup_data', {
+            'session_id': session_id,
+            'timestamp': '2025-11-22T14:30:00.000Z',
+            'setup': sample_setup_data
+        })
         monitor.emit('telemetry_update', {
             'session_id': session_id,
             'telemetry': sample_telemetry_data
         })
 
-        # All dashboards receive update
-        for dashboard in dashboards:
-            received = dashboard.get_received()
-            assert len(received) >= 1
-            telem_msg = next((msg for msg in received if msg['name'] == 'telemetry_update'), None)
-            assert telem_msg is not None
-            assert telem_msg['args'][0]['telemetry']['lap'] == sample_telemetry_data['lap']
+        assert drain(monitor) == []
+        names = [msg['name'] for msg in drain(dashboard)]
+        assert names == ['setup_update', 'telemetry_update']
 
-    def test_session_isolation(self, app):
+    def test_session_isolation(self, sio_clients, dashboard_factory):
         """
         Test that sessions are isolated (no cross-contamination).
 
@@ -456,33 +441,26 @@ class TestBroadcasting:
             5. Only Dashboard A receives it (not Dashboard B)
 
         Verifies:
-            - Session rooms are isolated
+            - Session broadcasts are isolated
             - No cross-talk between sessions
             - Broadcasting is scoped correctly
         """
-        from app import socketio
 
         # Create session 1
-        monitor1 = socketio.test_client(app)
+        monitor1 = sio_clients()
         monitor1.emit('request_session_id', {})
-        response1 = monitor1.get_received()
-        session_id_1 = response1[0]['args'][0]['session_id']
+        session_id_1 = extract_sid(drain(monitor1))
 
         # Create session 2
-        monitor2 = socketio.test_client(app)
+        monitor2 = sio_clients()
         monitor2.emit('request_session_id', {})
-        response2 = monitor2.get_received()
-        session_id_2 = response2[0]['args'][0]['session_id']
+        session_id_2 = extract_sid(drain(monitor2))
 
         # Dashboard A joins session 1
-        dashboard_a = socketio.test_client(app)
-        dashboard_a.emit('join_session', {'session_id': session_id_1})
-        dashboard_a.get_received()
+        dashboard_a = dashboard_factory(session_id_1)
 
         # Dashboard B joins session 2
-        dashboard_b = socketio.test_client(app)
-        dashboard_b.emit('join_session', {'session_id': session_id_2})
-        dashboard_b.get_received()
+        dashboard_b = dashboard_factory(session_id_2)
 
         # Monitor 1 sends telemetry
         telemetry_1 = generate_telemetry(lap=10)
@@ -492,14 +470,13 @@ class TestBroadcasting:
         })
 
         # Dashboard A receives update
-        received_a = dashboard_a.get_received()
+        received_a = drain(dashboard_a)
         assert len(received_a) >= 1
 
         # Dashboard B should NOT receive update
-        received_b = dashboard_b.get_received()
+        received_b = drain(dashboard_b)
         # Dashboard B should have no messages or only non-telemetry messages
-        telemetry_msgs = [msg for msg in received_b if msg['name'] == 'telemetry_update']
-        assert len(telemetry_msgs) == 0
+        assert 'telemetry_update' not in by_name(received_b)
 
 
 @pytest.mark.unit
@@ -512,7 +489,7 @@ class TestConnectionEvents:
         - disconnect: Client disconnects from server
     """
 
-    def test_client_connect(self, app):
+    def test_client_connect(self, sio_clients):
         """
         Test client can connect to WebSocket server.
 
@@ -520,12 +497,11 @@ class TestConnectionEvents:
             - Connection succeeds
             - Client is marked as connected
         """
-        from app import socketio
 
-        client = socketio.test_client(app)
+        client = sio_clients()
         assert client.is_connected()
 
-    def test_client_disconnect(self, app):
+    def test_client_disconnect(self, sio_clients):
         """
         Test client can disconnect from server.
 
@@ -533,38 +509,59 @@ class TestConnectionEvents:
             - Disconnection works
             - No errors on disconnect
         """
-        from app import socketio
 
-        client = socketio.test_client(app)
+        client = sio_clients()
         assert client.is_connected()
 
         client.disconnect()
         assert not client.is_connected()
 
-    def test_reconnection_after_disconnect(self, app):
+    def test_disconnect_unsubscribes_dashboard(self, monitor_session, sio_clients):
+        """
+        Test that a disconnecting dashboard stops receiving broadcasts.
+
+        Verifies:
+            - Dashboard SID is tracked on join
+            - SID is removed from the session on disconnect
+        """
+
+        monitor, session_id = monitor_session
+
+        dashboard = sio_clients()
+        dashboard.emit('join_session', {'session_id': session_id})
+        assert len(session_manager.get_session(session_id).dashboard_sids) == 1
+
+        dashboard.disconnect()
+        assert session_manager.get_session(session_id).dashboard_sids == set()
+
+    def test_reconnection_after_disconnect(self, sio_clients):
         """
         Test client can reconnect after disconnecting.
 
         Flow:
             1. Client connects
             2. Client disconnects
-            3. New client connects
-            4. Both connections work correctly
+            3. Same client connects again
+            4. Reconnected client works correctly
 
         Verifies:
             - Reconnection is supported
             - No state corruption
         """
-        from app import socketio
 
         # First connection
-        client1 = socketio.test_client(app)
-        assert client1.is_connected()
-        client1.disconnect()
+        client = sio_clients()
+        assert client.is_connected()
+        client.disconnect()
+        assert not client.is_connected()
 
         # Second connection (reconnect)
-        client2 = socketio.test_client(app)
-        assert client2.is_connected()
+        client.connect()
+        assert client.is_connected()
+
+        # Reconnected client is fully usable
+        client.emit('request_session_id', {})
+        assert drain(client)[0]['name'] == 'session_id_assigned'
 
 
 @pytest.mark.unit
@@ -579,126 +576,39 @@ class TestErrorHandling:
         - Malformed data
     """
 
-    def test_join_invalid_session_id(self, app):
-        """
-        Test dashboard joining with invalid session ID.
+    @pytest.mark.parametrize("event, build_payload", [
+        ('join_session', lambda setup, telemetry: {'session_id': 'invalid-uuid-format'}),
+        ('join_session', lambda setup, telemetry: {'session_id': FAKE_SID}),
+        ('join_session', lambda setup, telemetry: {}),
+        ('setup_data', lambda setup, telemetry: {
+            'session_id': FAKE_SID,
+            'timestamp': '2025-11-22T14:30:00.000Z',
+            'setup': setup
+        }),
+        ('telemetry_update', lambda setup, telemetry: {
+            'session_id': FAKE_SID,
+            'telemetry': telemetry
+        }),
+    ], ids=['join-invalid-id', 'join-nonexistent-session', 'join-missing-session-id',
+            'setup-nonexistent-session', 'telemetry-nonexistent-session'])
+    def test_bad_session_handled(self, sio_clients, sample_setup_data, sample_telemetry_data,
+                                 event, build_payload):
+        """
+        Test events with an invalid, unknown or missing session ID.
 
         Flow:
-            1. Dashboard tries to join with invalid UUID
-            2. Server handles gracefully (no crash)
+            1. Client emits the event without a usable session
+               (bad UUID, valid UUID with no session, or no session_id field)
+            2. Server handles gracefully (logs error but doesn't crash)
 
         Verifies:
-            - Invalid session IDs don't crash server
+            - Invalid session IDs and workflows don't crash server
+            - Missing required fields are handled
             - Client remains connected
         """
-        from app import socketio
-
-        dashboard = socketio.test_client(app)
-        assert dashboard.is_connected()
 
-        # Try to join with invalid session ID
-        dashboard.emit('join_session', {'session_id': 'invalid-uuid-format'})
+        client = sio_clients()
+        client.emit(event, build_payload(sample_setup_data, sample_telemetry_data))
 
         # Client should still be connected (graceful handling)
-        assert dashboard.is_connected()
-
-    def test_join_nonexistent_session(self, app):
-        """
-        Test dashboard joining non-existent session.
-
-        Flow:
-            1. Dashboard tries to join with valid UUID but session doesn't exist
-            2. Server handles gracefully
-
-        Verifies:
-            - Non-existent sessions don't crash server
-            - Error handling works correctly
-        """
-        from app import socketio
-
-        dashboard = socketio.test_client(app)
-        assert dashboard.is_connected()
-
-        # Try to join non-existent session (valid UUID format)
-        fake_session_id = str(uuid.uuid4())
-        dashboard.emit('join_session', {'session_id': fake_session_id})
-
-        # Client should still be connected
-        assert dashboard.is_connected()
-
-    def test_setup_data_invalid_session(self, app, sample_setup_data):
-        """
-        Test monitor sending setup for non-existent session.
-
-        Flow:
-            1. Monitor sends setup without requesting session first
-            2. Server handles gracefully (logs error but doesn't crash)
-
-        Verifies:
-            - Invalid workflows are handled
-            - Server doesn't crash
-        """
-        from app import socketio
-
-        monitor = socketio.test_client(app)
-        assert monitor.is_connected()
-
-        # Send setup with non-existent session ID
-        fake_session_id = str(uuid.uuid4())
-        monitor.emit('setup_data', {
-            'session_id': fake_session_id,
-            'timestamp': '2025-11-22T14:30:00.000Z',
-            'setup': sample_setup_data
-        })
-
-        # Monitor should still be connected
-        assert monitor.is_connected()
-
-    def test_telemetry_invalid_session(self, app, sample_telemetry_data):
-        """
-        Test monitor sending telemetry for non-existent session.
-
-        Flow:
-            1. Monitor sends telemetry without valid session
-            2. Server handles gracefully
-
-        Verifies:
-            - Invalid telemetry updates don't crash server
-        """
-        from app import socketio
-
-        monitor = socketio.test_client(app)
-        assert monitor.is_connected()
-
-        # Send telemetry with non-existent session ID
-        fake_session_id = str(uuid.uuid4())
-        monitor.emit('telemetry_update', {
-            'session_id': fake_session_id,
-            'telemetry': sample_telemetry_data
-        })
-
-        # Monitor should still be connected
-        assert monitor.is_connected()
-
-    def test_missing_session_id_field(self, app):
-        """
-        Test handling of events with missing session_id field.
-
-        Flow:
-            1. Dashboard tries to join without session_id in payload
-            2. Server handles gracefully
-
-        Verifies:
-            - Missing required fields don't crash server
-            - Error handling is robust
-        """
-        from app import socketio
-
-        dashboard = socketio.test_client(app)
-        assert dashboard.is_connected()
-
-        # Try to join without session_id field
-        dashboard.emit('join_session', {})
-
-        # Client should still be connected
-        assert dashboard.is_connected()
+        assert client.is_connected()
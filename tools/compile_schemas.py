@@ -0,0 +1,104 @@
+"""
+Generate app/_generated_validators.py from the payload JSON schemas.
+
+Compiles each schema in bugs/schemas/ to plain Python with
+fastjsonschema.compile_to_code, so the server can import ready-made
+validators instead of reading, parsing and compiling the schemas at startup.
+
+Usage:
+    python tools/compile_schemas.py          # Regenerate the module
+    python tools/compile_schemas.py --check  # Exit 1 if the module is stale
+
+Run this whenever a file in bugs/schemas/ changes and commit the result.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCHEMAS_DIR = PROJECT_ROOT / 'bugs' / 'schemas'
+OUTPUT_PATH = PROJECT_ROOT / 'app' / '_generated_validators.py'
+
+# Exported validator name -> schema file
+SCHEMAS = {
+    'validate_telemetry': 'telemetry_update.schema.json',
+    'validate_setup': 'setup_data.schema.json',
+}
+
+HEADER = '''"""
+Schema validators generated by tools/compile_schemas.py - DO NOT EDIT.
+
+Regenerate with `python tools/compile_schemas.py` after changing any schema
+in bugs/schemas/.
+"""
+'''
+
+
+def _compile(schema_file):
+    """
+    Compile one schema file to Python source.
+
+    Args:
+        schema_file: File name within bugs/schemas/
+
+    Returns:
+        Tuple of (module-level prelude, function definitions, entry function name)
+    """
+    schema = json.loads((SCHEMAS_DIR / schema_file).read_text(encoding='utf-8'))
+    # Same options as the runtime fallback in app.main._compile_validator
+    code = fastjsonschema.compile_to_code(schema, use_default=False, use_formats=False)
+    first_def = re.search(r'^def (\w+)\(', code, re.MULTILINE)
+    return code[:first_def.start()], code[first_def.start():], first_def.group(1)
+
+
+def generate():
+    """
+    Build the source of app/_generated_validators.py.
+
+    Returns:
+        str: Complete module source
+    """
+    prelude = None
+    bodies = []
+    aliases = []
+    for name, schema_file in SCHEMAS.items():
+        schema_prelude, body, entry = _compile(schema_file)
+        # Imports and helpers are identical for every schema; keep one copy
+        prelude = prelude or schema_prelude
+        bodies.append(body.rstrip() + '\n')
+        aliases.append(f'{name} = {entry}\n')
+
+    return HEADER + prelude + '\n\n'.join(bodies) + '\n\n' + ''.join(aliases)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description='Generate app/_generated_validators.py from bugs/schemas/.'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='exit 1 if the generated module is out of date instead of writing it'
+    )
+    args = parser.parse_args(argv)
+
+    source = generate()
+    if args.check:
+        current = OUTPUT_PATH.read_text(encoding='utf-8') if OUTPUT_PATH.exists() else ''
+        if current != source:
+            print(f'{OUTPUT_PATH} is out of date; run tools/compile_schemas.py')
+            return 1
+        return 0
+
+    OUTPUT_PATH.write_text(source, encoding='utf-8')
+    print(f'Wrote {OUTPUT_PATH}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))